@@ -1,28 +1,79 @@
 import os
 from flask import Flask
-from flask_sqlalchemy import SQLAlchemy
-from flask_migrate import Migrate
-from dotenv import load_dotenv
-from flasgger import Swagger
-from flask_jwt_extended import JWTManager
-from flask_marshmallow import Marshmallow
 from flask_cors import CORS
+from config import config_profiles
+from extensions import db, migrate, jwt, ma
+from services.json_provider import FastJSONProvider
+from services.password_hasher import password_hasher
+from services.query_stats import init_query_stats
+from services.metrics import metrics
+from services.db_pool import engine_options, init_pool
+from services.db_routing import replica_binds, init_replica_routing
+from services.swagger_spec import init_swagger
+from services.compression import init_compression
+from services.read_model import init_read_model
+from services.search_index import init_search_index
 
-load_dotenv()
 
-app = Flask(__name__)
-app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL')
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-app.config['SECRET_KEY'] = os.getenv('SECRET_KEY')
+def create_app(config=None, with_views=True):
+    """
+    Arma la aplicación. `config` puede ser el nombre de un perfil
+    (development, production, testing), una clase de configuración o un dict
+    que se aplica sobre el perfil de APP_CONFIG. Con with_views=False no se
+    importan las vistas ni se instala la capa HTTP (para la CLI).
+    """
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
 
-CORS(app)
+    if config is None or isinstance(config, dict):
+        app.config.from_object(config_profiles[os.getenv('APP_CONFIG', 'development')])
+        app.config.update(config or {})
+    elif isinstance(config, str):
+        app.config.from_object(config_profiles[config])
+    else:
+        app.config.from_object(config)
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', engine_options(app.config))
+    app.config.setdefault('SQLALCHEMY_BINDS', replica_binds(app.config['DATABASE_REPLICA_URLS']))
 
-db = SQLAlchemy(app)
-migrate = Migrate(app, db)
-jwt = JWTManager(app)
-ma = Marshmallow(app)
+    db.init_app(app)
+    migrate.init_app(app, db)
+    jwt.init_app(app)
+    ma.init_app(app)
+    password_hasher.init_app(app)
+    init_replica_routing(app, db)
+    init_read_model()
+    init_search_index(app)
 
-swagger = Swagger(app)
+    # Los modelos se registran siempre para que `flask db migrate` los vea
+    import models
 
-from views import register_bp
-register_bp(app)
+    from commands import register_commands
+    register_commands(app)
+
+    if not with_views:
+        return app
+
+    # Se registra primero para que sea el último after_request en correr
+    init_compression(app)
+    CORS(app, expose_headers=['X-Next-Cursor', 'ETag'])
+    init_query_stats(app)
+    metrics.init_app(app)
+
+    init_pool(app, db)
+
+    if app.config['SEARCH_INDEX_WARMUP'] and app.config['SEARCH_BACKEND'] == 'memory':
+        with app.app_context():
+            try:
+                app.extensions['publication_search_index'].warm_up(app.config['SEARCH_INDEX_TTL'])
+            except Exception as e:
+                app.logger.warning('No se pudo armar el índice de búsqueda: %s', e)
+
+    from services.expiry_sweeper import expiry_sweeper
+    expiry_sweeper.init_app(app)
+
+    init_swagger(app)
+
+    from views import register_bp
+    register_bp(app)
+
+    return app
@@ -0,0 +1,111 @@
+"""
+Recorre los endpoints de cada blueprint con el test client de Flask sobre
+una base SQLite generada con seed_bulk, para varios tamaños de datos.
+Reporta latencia (p50/p95), consultas por request y pico de memoria.
+
+    python benchmarks/bench_endpoints.py --sizes 100,1000,10000 --requests 20
+"""
+import argparse
+import base64
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DB_PATH = os.path.join(tempfile.mkdtemp(), 'bench.db')
+os.environ['DATABASE_URL'] = f'sqlite:///{DB_PATH}'
+os.environ.setdefault('SECRET_KEY', 'benchmark')
+os.environ.setdefault('PASSWORD_HASH_WORKERS', '0')
+os.environ.setdefault('FEED_CACHE_TTL', '0')
+
+from app import create_app
+from extensions import db
+from services.seed_bulk import seed_bulk, DEFAULT_PASSWORD
+
+app = create_app()
+
+ENDPOINTS = [
+    ('auth', 'POST', '/login', 'basic'),
+    ('user', 'GET', '/users', 'admin'),
+    ('property', 'GET', '/property?limit=100', 'admin'),
+    ('property', 'GET', '/property?active=true&rooms=3&monthly_rent_min=500&monthly_rent_max=1500&limit=100', 'admin'),
+    ('publication', 'GET', '/publications?limit=100', None),
+    ('publication', 'GET', '/publications?limit=100', 'admin'),
+    ('publication', 'GET', '/publications?limit=100&fields=id,title,price_shown,image.url', 'admin'),
+    ('image', 'GET', '/image', 'admin'),
+    ('contract', 'GET', '/contract', 'admin'),
+    ('export', 'GET', '/export/publications', 'admin'),
+    ('monitoring', 'GET', '/health', None),
+]
+
+
+def prepare(size):
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        seed_bulk(
+            users=max(size // 20, 2),
+            properties=size,
+            images=max(size // 4, 1),
+            publications=size,
+            contracts=size // 2,
+            seed=size,
+        )
+        return db.session.execute(db.text("SELECT username FROM user WHERE is_admin LIMIT 1")).scalar()
+
+
+def measure(client, method, url, headers, count):
+    latencies = []
+    queries = []
+    tracemalloc.start()
+    for _ in range(count):
+        start = time.perf_counter()
+        response = client.open(url, method=method, headers=headers)
+        body = response.get_data()
+        latencies.append((time.perf_counter() - start) * 1000)
+        queries.append(int(response.headers.get('X-DB-Queries', 0)))
+        assert response.status_code < 400, (url, response.status_code, body[:200])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    latencies.sort()
+    return {
+        'p50': statistics.median(latencies),
+        'p95': latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        'queries': max(queries),
+        'peak_kb': peak / 1024,
+        'bytes': len(body),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', default='100,1000,10000')
+    parser.add_argument('--requests', type=int, default=20)
+    args = parser.parse_args()
+
+    client = app.test_client()
+    print(f'{"filas":>7}  {"bp":<12}{"endpoint":<58}{"p50 ms":>9}{"p95 ms":>9}{"queries":>9}{"peak KB":>10}{"bytes":>10}')
+    for size in [int(s) for s in args.sizes.split(',')]:
+        admin = prepare(size)
+        credentials = base64.b64encode(f'{admin}:{DEFAULT_PASSWORD}'.encode()).decode()
+        token = client.post('/login', headers={'Authorization': f'Basic {credentials}'}).get_json()['token']
+        auth_headers = {
+            None: {},
+            'basic': {'Authorization': f'Basic {credentials}'},
+            'admin': {'Authorization': f'Bearer {token}'},
+        }
+        for blueprint, method, url, auth in ENDPOINTS:
+            count = 3 if auth == 'basic' else args.requests
+            result = measure(client, method, url, auth_headers[auth], count)
+            label = f'{method} {url}'[:56] + (' *' if auth else '')
+            print(
+                f'{size:>7}  {blueprint:<12}{label:<58}{result["p50"]:>9.1f}{result["p95"]:>9.1f}'
+                f'{result["queries"]:>9}{result["peak_kb"]:>10.0f}{result["bytes"]:>10}'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Compara el dump de marshmallow + el JSON por defecto de Flask contra el
+serializador compilado + FastJSONProvider sobre filas sintéticas.
+
+    python benchmarks/bench_serializers.py --rows 10000
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+os.environ.setdefault('SECRET_KEY', 'benchmark')
+
+from flask.json.provider import DefaultJSONProvider
+from app import create_app
+from models import Property, Image, Publication
+from schemas import PropertySchema, ImageSchema, PublicationSchema, MinimalPublicationSchema
+from services.json_provider import FastJSONProvider
+from services.serializers import dump_many
+
+app = create_app()
+
+
+def build_rows(count):
+    publications = []
+    for i in range(1, count + 1):
+        property = Property(
+            id=i, address=f'Calle {i} Nº {i * 7}', rooms=i % 5 + 1, bathrooms=i % 3 + 1,
+            garage_capacity=i % 2, year_built=1950 + i % 70, property_status_id=1,
+            monthly_rent=Decimal(1000 + i % 900) + Decimal('0.50'), owner_id=1, active=True,
+        )
+        image = Image(id=i, name=f'Frente {i}', url=f'https://example.com/{i}.jpg')
+        publications.append(Publication(
+            id=i, property_id=i, image_id=i, user_id=1, title=f'Casa luminosa en Córdoba {i}',
+            description='Departamento con balcón, cocina y jardín.', price_shown=Decimal(1200 + i % 800),
+            publication_status_id=1, publish_date=date(2024, 1, 1) + timedelta(days=i % 365),
+            expiry_date=None, status='active', property=property, image=image,
+        ))
+    return publications
+
+
+def timed(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    publications = build_rows(args.rows)
+    cases = [
+        ('PublicationSchema', PublicationSchema, publications),
+        ('MinimalPublicationSchema', MinimalPublicationSchema, publications),
+        ('PropertySchema', PropertySchema, [p.property for p in publications]),
+        ('ImageSchema', ImageSchema, [p.image for p in publications]),
+    ]
+    default_json = DefaultJSONProvider(app)
+    fast_json = FastJSONProvider(app)
+
+    print(f'{"schema":<26}{"marshmallow":>14}{"compilado":>14}{"speedup":>10}')
+    with app.app_context():
+        for name, schema_cls, objs in cases:
+            slow, slow_body = timed(lambda: default_json.dumps(schema_cls().dump(objs, many=True)), args.repeat)
+            fast, fast_body = timed(lambda: fast_json.dumps(dump_many(schema_cls, objs)), args.repeat)
+
+            # Mismo proveedor JSON -> mismos bytes
+            assert default_json.dumps(dump_many(schema_cls, objs)) == slow_body, name
+            assert fast_json.loads(fast_body) == default_json.loads(slow_body), name
+
+            print(f'{name:<26}{slow * 1000:>12.1f}ms{fast * 1000:>12.1f}ms{slow / fast:>9.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+
+@click.command('seed-bulk')
+@click.option('--users', default=0, help='Cantidad de usuarios (con su Person)')
+@click.option('--properties', default=0, help='Cantidad de propiedades')
+@click.option('--images', default=0, help='Cantidad de imágenes')
+@click.option('--publications', default=0, help='Cantidad de publicaciones')
+@click.option('--contracts', default=0, help='Cantidad de contratos')
+@click.option('--batch-size', default=1000, help='Filas por INSERT')
+@click.option('--seed', default=None, type=int, help='Semilla para datos reproducibles')
+@with_appcontext
+def seed_bulk_command(users, properties, images, publications, contracts, batch_size, seed):
+    """Genera datos sintéticos consistentes para pruebas de carga."""
+    from services.seed_bulk import seed_bulk
+
+    try:
+        counts = seed_bulk(
+            users=users,
+            properties=properties,
+            images=images,
+            publications=publications,
+            contracts=contracts,
+            batch_size=batch_size,
+            seed=seed,
+        )
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    click.echo(', '.join(f'{count} {name}' for name, count in counts.items()))
+
+
+@click.command('swagger-build')
+@click.option('--output', default=None, help='Archivo destino (por defecto SWAGGER_SPEC_FILE)')
+@with_appcontext
+def swagger_build_command(output):
+    """Genera el spec de Swagger para servirlo con SWAGGER_MODE=static."""
+    from services.swagger_spec import write_spec
+
+    path = output or current_app.config['SWAGGER_SPEC_FILE']
+    spec = write_spec(current_app._get_current_object(), path)
+    click.echo(f"{len(spec.get('paths', {}))} rutas documentadas en {path}")
+
+
+@click.command('build-feed-snapshot')
+@click.option('--output', default=None, help='Archivo destino (por defecto FEED_SNAPSHOT_PATH)')
+@with_appcontext
+def build_feed_snapshot_command(output):
+    """Genera el snapshot del feed anónimo que los workers sirven con mmap."""
+    from services.feed_snapshot import write_snapshot
+
+    path = output or current_app.config['FEED_SNAPSHOT_PATH']
+    if not path:
+        raise click.ClickException('Falta FEED_SNAPSHOT_PATH o --output')
+    if not write_snapshot(path, current_app.config['FEED_SNAPSHOT_BATCH_SIZE']):
+        raise click.ClickException(f'Otro proceso está generando {path}')
+    click.echo(f'Snapshot del feed escrito en {path}')
+
+
+@click.command('expire-publications')
+@click.option('--batch-size', default=None, type=int, help='Publicaciones por transacción (por defecto EXPIRY_SWEEP_BATCH_SIZE)')
+@click.option('--max-batches', default=None, type=int, help='Cortar después de esta cantidad de lotes')
+@with_appcontext
+def expire_publications_command(batch_size, max_batches):
+    """Desactiva las publicaciones con expiry_date vencida."""
+    from services.expiry_sweeper import expire_publications
+
+    # Los workers regeneran el snapshot del feed cuando ven la nueva versión; desde la CLI no hace falta
+    expired = expire_publications(
+        batch_size or current_app.config['EXPIRY_SWEEP_BATCH_SIZE'],
+        pause=current_app.config['EXPIRY_SWEEP_PAUSE'],
+        max_batches=max_batches,
+        rebuild_snapshot=False,
+    )
+    click.echo(f'{expired} publicaciones vencidas pasaron a inactivas')
+
+
+def register_commands(app):
+    app.cli.add_command(seed_bulk_command)
+    app.cli.add_command(swagger_build_command)
+    app.cli.add_command(build_feed_snapshot_command)
+    app.cli.add_command(expire_publications_command)
@@ -0,0 +1,86 @@
+import os
+import json
+from decimal import Decimal
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class Config:
+    SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL')
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SECRET_KEY = os.getenv('SECRET_KEY')
+    FEED_CACHE_TTL = float(os.getenv('FEED_CACHE_TTL', 5))
+    EXPORT_BATCH_SIZE = int(os.getenv('EXPORT_BATCH_SIZE', 1000))
+    BULK_MAX_ITEMS = int(os.getenv('BULK_MAX_ITEMS', 5000))
+    BULK_CHUNK_SIZE = int(os.getenv('BULK_CHUNK_SIZE', 500))
+    PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', 2))
+    PASSWORD_HASH_MAX_PENDING = int(os.getenv('PASSWORD_HASH_MAX_PENDING', 16))
+    PASSWORD_HASH_QUEUE_TIMEOUT = float(os.getenv('PASSWORD_HASH_QUEUE_TIMEOUT', 0.1))
+    USER_STATUS_CACHE_TTL = float(os.getenv('USER_STATUS_CACHE_TTL', 30))
+    DB_QUERY_BUDGET = int(os.getenv('DB_QUERY_BUDGET', 10))
+    DB_QUERY_BUDGETS = json.loads(os.getenv('DB_QUERY_BUDGETS', '{}'))
+    DB_REPEATED_QUERY_THRESHOLD = int(os.getenv('DB_REPEATED_QUERY_THRESHOLD', 3))
+    METRICS_DIR = os.getenv('METRICS_DIR')
+    METRICS_FLUSH_INTERVAL = float(os.getenv('METRICS_FLUSH_INTERVAL', 5))
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 10))
+    DB_POOL_MAX_OVERFLOW = int(os.getenv('DB_POOL_MAX_OVERFLOW', 20))
+    DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', 10))
+    DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', 280))
+    DB_POOL_PRE_PING = os.getenv('DB_POOL_PRE_PING', 'true').lower() == 'true'
+    DB_POOL_WARMUP = int(os.getenv('DB_POOL_WARMUP', 0))
+    DATABASE_REPLICA_URLS = os.getenv('DATABASE_REPLICA_URLS')
+    DB_PRIMARY_PIN_SECONDS = int(os.getenv('DB_PRIMARY_PIN_SECONDS', 5))
+    DB_REPLICA_RETRY_AFTER = int(os.getenv('DB_REPLICA_RETRY_AFTER', 30))
+    AVAILABILITY_INDEX = os.getenv('AVAILABILITY_INDEX', 'false').lower() == 'true'
+    AVAILABILITY_INDEX_TTL = float(os.getenv('AVAILABILITY_INDEX_TTL', 60))
+    SEARCH_BACKEND = os.getenv('SEARCH_BACKEND', 'memory')
+    SEARCH_INDEX_TTL = float(os.getenv('SEARCH_INDEX_TTL', 300))
+    SEARCH_INDEX_WARMUP = os.getenv('SEARCH_INDEX_WARMUP', 'false').lower() == 'true'
+    FEED_SNAPSHOT_PATH = os.getenv('FEED_SNAPSHOT_PATH')
+    FEED_SNAPSHOT_CHECK_INTERVAL = float(os.getenv('FEED_SNAPSHOT_CHECK_INTERVAL', 1))
+    FEED_SNAPSHOT_BATCH_SIZE = int(os.getenv('FEED_SNAPSHOT_BATCH_SIZE', 1000))
+    EXPIRY_SWEEP_INTERVAL = float(os.getenv('EXPIRY_SWEEP_INTERVAL', 0))
+    EXPIRY_SWEEP_BATCH_SIZE = int(os.getenv('EXPIRY_SWEEP_BATCH_SIZE', 500))
+    EXPIRY_SWEEP_PAUSE = float(os.getenv('EXPIRY_SWEEP_PAUSE', 0.1))
+    FACET_PRICE_BUCKETS = [Decimal(edge) for edge in os.getenv('FACET_PRICE_BUCKETS', '500,1000,1500,2000,3000').split(',') if edge.strip()]
+    COMPRESS_ENABLED = os.getenv('COMPRESS_ENABLED', 'true').lower() == 'true'
+    COMPRESS_MIN_SIZE = int(os.getenv('COMPRESS_MIN_SIZE', 500))
+    COMPRESS_LEVEL = int(os.getenv('COMPRESS_LEVEL', 6))
+    COMPRESS_BROTLI_QUALITY = int(os.getenv('COMPRESS_BROTLI_QUALITY', 4))
+    COMPRESS_STREAM_FLUSH_SIZE = int(os.getenv('COMPRESS_STREAM_FLUSH_SIZE', 64 * 1024))
+    SWAGGER_MODE = os.getenv('SWAGGER_MODE', 'dynamic')
+    SWAGGER_SPEC_FILE = os.getenv(
+        'SWAGGER_SPEC_FILE',
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'swagger.json'),
+    )
+
+
+class DevelopmentConfig(Config):
+    pass
+
+
+class ProductionConfig(Config):
+    SWAGGER_MODE = os.getenv('SWAGGER_MODE', 'static')
+
+
+class TestingConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = os.getenv('TEST_DATABASE_URL', 'sqlite://')
+    SECRET_KEY = 'testing'
+    FEED_CACHE_TTL = 0
+    USER_STATUS_CACHE_TTL = 0
+    PASSWORD_HASH_WORKERS = 0
+    METRICS_DIR = None
+    DB_POOL_WARMUP = 0
+    DATABASE_REPLICA_URLS = None
+    SWAGGER_MODE = 'off'
+    FEED_SNAPSHOT_PATH = None
+    EXPIRY_SWEEP_INTERVAL = 0
+
+
+config_profiles = {
+    'development': DevelopmentConfig,
+    'production': ProductionConfig,
+    'testing': TestingConfig,
+}
@@ -0,0 +1,10 @@
+from flask_sqlalchemy import SQLAlchemy
+from flask_migrate import Migrate
+from flask_jwt_extended import JWTManager
+from flask_marshmallow import Marshmallow
+from services.db_routing import RoutingSession
+
+db = SQLAlchemy(session_options={'class_': RoutingSession})
+migrate = Migrate()
+jwt = JWTManager()
+ma = Marshmallow()
@@ -0,0 +1,9 @@
+"""
+Entrada de la CLI sin la capa HTTP: no importa vistas, schemas ni flasgger.
+
+    FLASK_APP=manage flask db upgrade
+    FLASK_APP=manage flask seed-bulk --properties 1000
+"""
+from app import create_app
+
+app = create_app(with_views=False)
@@ -0,0 +1,35 @@
+"""add publication fulltext index
+
+Revision ID: a8b6c7d9e0f1
+Revises: f7a5b6c8d9e0
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8b6c7d9e0f1'
+down_revision = 'f7a5b6c8d9e0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Solo MySQL soporta FULLTEXT; en otros motores la búsqueda usa el índice en memoria
+    if op.get_bind().dialect.name != 'mysql':
+        return
+    op.create_index(
+        'ix_publication_fulltext',
+        'publication',
+        ['title', 'description'],
+        unique=False,
+        mysql_prefix='FULLTEXT'
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'mysql':
+        return
+    op.drop_index('ix_publication_fulltext', table_name='publication')
@@ -0,0 +1,29 @@
+"""add publication feed index
+
+Revision ID: b3c1f2a4d5e6
+Revises: 407eec0194b8
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3c1f2a4d5e6'
+down_revision = '407eec0194b8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_publication_status_publish_date_id',
+        'publication',
+        ['status', 'publish_date', 'id'],
+        unique=False
+    )
+
+
+def downgrade():
+    op.drop_index('ix_publication_status_publish_date_id', table_name='publication')
@@ -0,0 +1,59 @@
+"""add publication listing read model
+
+Revision ID: b9c7d8e0f1a2
+Revises: a8b6c7d9e0f1
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b9c7d8e0f1a2'
+down_revision = 'a8b6c7d9e0f1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('publication_listing',
+    sa.Column('publication_id', sa.Integer(), nullable=False),
+    sa.Column('property_id', sa.Integer(), nullable=False),
+    sa.Column('image_id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('price_shown', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('address', sa.String(length=255), nullable=False),
+    sa.Column('rooms', sa.Integer(), nullable=False),
+    sa.Column('bathrooms', sa.Integer(), nullable=False),
+    sa.Column('image_url', sa.String(length=255), nullable=False),
+    sa.Column('status', sa.Enum('active', 'inactive'), nullable=False),
+    sa.Column('publish_date', sa.Date(), nullable=True),
+    sa.ForeignKeyConstraint(['publication_id'], ['publication.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('publication_id')
+    )
+    with op.batch_alter_table('publication_listing', schema=None) as batch_op:
+        batch_op.create_index('ix_publication_listing_status_publish_date_id', ['status', 'publish_date', 'publication_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_publication_listing_property_id'), ['property_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_publication_listing_image_id'), ['image_id'], unique=False)
+
+    # Backfill con las publicaciones existentes
+    op.execute(
+        "INSERT INTO publication_listing (publication_id, property_id, image_id, title, price_shown, "
+        "address, rooms, bathrooms, image_url, status, publish_date) "
+        "SELECT publication.id, publication.property_id, publication.image_id, publication.title, "
+        "publication.price_shown, property.address, property.rooms, property.bathrooms, image.url, "
+        "publication.status, publication.publish_date "
+        "FROM publication "
+        "JOIN property ON property.id = publication.property_id "
+        "JOIN image ON image.id = publication.image_id"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('publication_listing', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_publication_listing_image_id'))
+        batch_op.drop_index(batch_op.f('ix_publication_listing_property_id'))
+        batch_op.drop_index('ix_publication_listing_status_publish_date_id')
+
+    op.drop_table('publication_listing')
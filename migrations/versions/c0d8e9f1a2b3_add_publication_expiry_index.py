@@ -0,0 +1,29 @@
+"""add publication expiry index
+
+Revision ID: c0d8e9f1a2b3
+Revises: b9c7d8e0f1a2
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c0d8e9f1a2b3'
+down_revision = 'b9c7d8e0f1a2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_publication_status_expiry_date',
+        'publication',
+        ['status', 'expiry_date'],
+        unique=False
+    )
+
+
+def downgrade():
+    op.drop_index('ix_publication_status_expiry_date', table_name='publication')
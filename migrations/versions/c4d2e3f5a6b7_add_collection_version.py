@@ -0,0 +1,39 @@
+"""add collection version
+
+Revision ID: c4d2e3f5a6b7
+Revises: b3c1f2a4d5e6
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4d2e3f5a6b7'
+down_revision = 'b3c1f2a4d5e6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    collection_version = op.create_table('collection_version',
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+    op.bulk_insert(
+        collection_version,
+        [
+            {'name': 'user', 'version': 0},
+            {'name': 'property', 'version': 0},
+            {'name': 'image', 'version': 0},
+            {'name': 'publication', 'version': 0},
+            {'name': 'contract', 'version': 0},
+        ]
+    )
+
+
+def downgrade():
+    op.drop_table('collection_version')
@@ -0,0 +1,36 @@
+"""add property search indexes
+
+Revision ID: d5e3f4a6b7c8
+Revises: c4d2e3f5a6b7
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5e3f4a6b7c8'
+down_revision = 'c4d2e3f5a6b7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_property_active_rooms_monthly_rent',
+        'property',
+        ['active', 'rooms', 'monthly_rent'],
+        unique=False
+    )
+    op.create_index(
+        'ix_property_active_monthly_rent',
+        'property',
+        ['active', 'monthly_rent'],
+        unique=False
+    )
+
+
+def downgrade():
+    op.drop_index('ix_property_active_monthly_rent', table_name='property')
+    op.drop_index('ix_property_active_rooms_monthly_rent', table_name='property')
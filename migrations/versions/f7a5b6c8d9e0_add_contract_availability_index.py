@@ -0,0 +1,29 @@
+"""add contract availability index
+
+Revision ID: f7a5b6c8d9e0
+Revises: e6f4a5b7c8d9
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f7a5b6c8d9e0'
+down_revision = 'e6f4a5b7c8d9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_contract_property_start_end',
+        'contract',
+        ['property_id', 'start_date', 'end_date'],
+        unique=False
+    )
+
+
+def downgrade():
+    op.drop_index('ix_contract_property_start_end', table_name='contract')
@@ -1,4 +1,4 @@
-from app import db
+from extensions import db
 from datetime import date
 
 class Person(db.Model):
@@ -16,11 +16,17 @@ class User(db.Model):
     password = db.Column(db.String(200), nullable=False)
     is_active = db.Column(db.Boolean, nullable=False, default=True)
     is_admin = db.Column(db.Boolean, nullable=False, default=False)
+    token_version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
 
     person_id = db.Column(db.Integer, db.ForeignKey('person.id'), nullable=False)
     person = db.relationship('Person', back_populates='user')
 
 class Property(db.Model):
+    __table_args__ = (
+        db.Index('ix_property_active_rooms_monthly_rent', 'active', 'rooms', 'monthly_rent'),
+        db.Index('ix_property_active_monthly_rent', 'active', 'monthly_rent'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     address = db.Column(db.String(255), nullable=False)
     rooms = db.Column(db.Integer, nullable=False)
@@ -40,6 +46,12 @@ class Image(db.Model):
     url = db.Column(db.String(255), nullable=False)
 
 class Publication(db.Model):
+    __table_args__ = (
+        db.Index('ix_publication_status_publish_date_id', 'status', 'publish_date', 'id'),
+        db.Index('ix_publication_status_expiry_date', 'status', 'expiry_date'),
+        db.Index('ix_publication_fulltext', 'title', 'description', mysql_prefix='FULLTEXT'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     property_id = db.Column(db.Integer, db.ForeignKey('property.id'), nullable=False)
     image_id = db.Column(db.Integer, db.ForeignKey('image.id'), nullable=False)
@@ -57,6 +69,10 @@ class Publication(db.Model):
     user = db.relationship('User', backref='publications')
 
 class Contract(db.Model):
+    __table_args__ = (
+        db.Index('ix_contract_property_start_end', 'property_id', 'start_date', 'end_date'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     property_id = db.Column(db.Integer, db.ForeignKey('property.id'), nullable=False)
     renter_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
@@ -70,3 +86,27 @@ class Contract(db.Model):
     renter = db.relationship('User', foreign_keys=[renter_id])
     owner = db.relationship('User', foreign_keys=[owner_id])
 
+
+# Copia plana de publicación + propiedad + imagen para el feed; la mantiene services/read_model.py
+class PublicationListing(db.Model):
+    __tablename__ = 'publication_listing'
+    __table_args__ = (
+        db.Index('ix_publication_listing_status_publish_date_id', 'status', 'publish_date', 'publication_id'),
+    )
+
+    publication_id = db.Column(db.Integer, db.ForeignKey('publication.id', ondelete='CASCADE'), primary_key=True)
+    property_id = db.Column(db.Integer, nullable=False, index=True)
+    image_id = db.Column(db.Integer, nullable=False, index=True)
+    title = db.Column(db.String(255), nullable=False)
+    price_shown = db.Column(db.Numeric(10, 2), nullable=False)
+    address = db.Column(db.String(255), nullable=False)
+    rooms = db.Column(db.Integer, nullable=False)
+    bathrooms = db.Column(db.Integer, nullable=False)
+    image_url = db.Column(db.String(255), nullable=False)
+    status = db.Column(db.Enum('active', 'inactive'), nullable=False)
+    publish_date = db.Column(db.Date, nullable=True)
+
+
+class CollectionVersion(db.Model):
+    name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
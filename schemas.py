@@ -1,5 +1,5 @@
-from app import ma
-from models import User, Property, Publication, Image
+from extensions import ma
+from models import User, Property, Publication, Image, PublicationListing
 from marshmallow import fields
 
 class UserSchema(ma.SQLAlchemySchema):
@@ -30,7 +30,7 @@ class PropertySchema(ma.SQLAlchemySchema):
     garage_capacity = fields.Int()
     year_built = fields.Int()
     property_status_id = fields.Int()
-    monthly_rent = fields.Decimal(as_string=True)
+    monthly_rent = fields.Decimal(as_string=True, required=True)
     owner_id = fields.Int(required=True)
     active = fields.Bool()
 
@@ -79,6 +79,22 @@ class MinimalPublicationSchema(ma.SQLAlchemySchema):
     property = fields.Nested(PropertySchema)
     image = fields.Nested(ImageSchema)
 
+class PublicationListingSchema(ma.SQLAlchemySchema):
+    class Meta:
+        model = PublicationListing
+
+    publication_id = fields.Int(dump_only=True)
+    property_id = fields.Int()
+    image_id = fields.Int()
+    title = fields.Str()
+    price_shown = fields.Decimal(as_string=True)
+    address = fields.Str()
+    rooms = fields.Int()
+    bathrooms = fields.Int()
+    image_url = fields.Str()
+    status = fields.Str()
+    publish_date = fields.Date()
+
 class ContractSchema(ma.SQLAlchemySchema):
     id = fields.Int(dump_only=True)
     property_id = fields.Int(required=True)
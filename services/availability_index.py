@@ -0,0 +1,119 @@
+import threading
+import time
+from bisect import bisect_right
+from sqlalchemy import select
+from extensions import db
+from models import Contract, Property
+
+
+def contract_overlaps(start, end):
+    """Contratos vigentes que se superponen con [start, end] (ambos extremos incluidos)."""
+    return (
+        Contract.start_date <= end,
+        Contract.end_date >= start,
+        Contract.status.isnot(False),
+    )
+
+
+class ContractIntervalIndex:
+    """
+    Contratos vigentes de cada propiedad activa, ordenados por fecha de inicio
+    junto con el máximo end_date acumulado. Una propiedad está ocupada en
+    [start, end] si algún contrato que empieza antes de `end` termina después
+    de `start`, y eso se resuelve con una bisección.
+
+    Se recarga entero cuando vence el TTL (así se ven las escrituras de otros
+    workers) y por propiedad cuando este worker modifica contratos o
+    propiedades.
+    """
+
+    def __init__(self):
+        self._properties = None
+        self._expires = 0
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+
+    def is_available(self, property_id, start, end, ttl):
+        """True/False, o None si la propiedad no está activa o no existe."""
+        properties = self._get_properties(ttl)
+        intervals = properties.get(property_id)
+        if intervals is None:
+            return None
+        starts, max_ends = intervals
+        position = bisect_right(starts, end)
+        return position == 0 or max_ends[position - 1] < start
+
+    def refresh(self, property_id):
+        # Si el índice no se cargó todavía no hay nada que actualizar
+        if self._properties is None:
+            return
+        active = db.session.execute(
+            select(Property.active).where(Property.id == property_id)
+        ).scalar()
+        intervals = None
+        if active:
+            rows = db.session.execute(
+                select(Contract.start_date, Contract.end_date)
+                .where(Contract.property_id == property_id, Contract.status.isnot(False))
+                .order_by(Contract.start_date)
+            ).all()
+            intervals = build_intervals(rows)
+
+        with self._lock:
+            properties = dict(self._properties)
+            if intervals is None:
+                properties.pop(property_id, None)
+            else:
+                properties[property_id] = intervals
+            self._properties = properties
+
+    def invalidate(self):
+        self._expires = 0
+
+    def _get_properties(self, ttl):
+        if self._properties is not None and self._expires > time.monotonic():
+            return self._properties
+        if self._properties is not None and not self._load_lock.acquire(blocking=False):
+            # Otro request ya lo está recargando
+            return self._properties
+        if self._properties is None:
+            self._load_lock.acquire()
+        try:
+            if self._properties is None or self._expires <= time.monotonic():
+                properties = self._load()
+                with self._lock:
+                    self._properties = properties
+                    self._expires = time.monotonic() + ttl
+            return self._properties
+        finally:
+            self._load_lock.release()
+
+    def _load(self):
+        active_ids = db.session.execute(
+            select(Property.id).where(Property.active.is_(True))
+        ).scalars()
+        contracts = {property_id: [] for property_id in active_ids}
+
+        rows = db.session.execute(
+            select(Contract.property_id, Contract.start_date, Contract.end_date)
+            .join(Property, Property.id == Contract.property_id)
+            .where(Property.active.is_(True), Contract.status.isnot(False))
+            .order_by(Contract.property_id, Contract.start_date)
+        )
+        for property_id, start_date, end_date in rows:
+            contracts[property_id].append((start_date, end_date))
+        return {property_id: build_intervals(rows) for property_id, rows in contracts.items()}
+
+
+def build_intervals(rows):
+    starts = []
+    max_ends = []
+    latest = None
+    for start_date, end_date in rows:
+        latest = end_date if latest is None else max(latest, end_date)
+        starts.append(start_date)
+        max_ends.append(latest)
+    return starts, max_ends
+
+
+contract_interval_index = ContractIntervalIndex()
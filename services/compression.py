@@ -0,0 +1,149 @@
+import zlib
+from flask import request, current_app
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES = {
+    'application/json',
+    'application/x-ndjson',
+    'text/csv',
+    'text/html',
+    'text/plain',
+    'text/css',
+    'application/javascript',
+    'text/javascript',
+}
+
+
+def available_encodings():
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def init_compression(app):
+    """
+    Comprime las respuestas con gzip (o brotli si el paquete está instalado y
+    el cliente lo prefiere). Los cuerpos chicos se dejan como están; los
+    streaming se comprimen por partes a medida que se generan. El ETag lleva
+    el sufijo de la codificación para no confundir las dos representaciones.
+    """
+    app.after_request(_compress_response)
+
+
+def etag_candidates(etag):
+    """El ETag sin comprimir y sus variantes comprimidas, para comparar contra If-None-Match."""
+    return (etag, *(f'{etag}-{encoding}' for encoding in available_encodings()))
+
+
+def _compress_response(response):
+    config = current_app.config
+
+    if not config['COMPRESS_ENABLED'] or response.mimetype not in COMPRESSIBLE_MIMETYPES:
+        return response
+    response.vary.add('Accept-Encoding')
+
+    if response.status_code == 304:
+        _match_encoded_etag(response)
+        return response
+    if (
+        response.status_code < 200
+        or response.status_code == 204
+        or response.direct_passthrough
+        or 'Content-Encoding' in response.headers
+        or response.cache_control.no_transform
+    ):
+        return response
+
+    encoding = request.accept_encodings.best_match(available_encodings())
+    if encoding is None:
+        return response
+
+    if response.is_streamed:
+        response.response = _compress_stream(
+            response.response,
+            _compressor(encoding, config),
+            config['COMPRESS_STREAM_FLUSH_SIZE'],
+        )
+        response.headers.pop('Content-Length', None)
+    else:
+        data = response.get_data()
+        if len(data) < config['COMPRESS_MIN_SIZE']:
+            return response
+        compressor = _compressor(encoding, config)
+        response.set_data(compressor.compress(data) + compressor.flush())
+
+    response.headers['Content-Encoding'] = encoding
+    etag, weak = response.get_etag()
+    if etag:
+        response.set_etag(f'{etag}-{encoding}', weak)
+        if not response.is_streamed:
+            response.make_conditional(request)
+    return response
+
+
+def _match_encoded_etag(response):
+    # El 304 devuelve el ETag con el sufijo que tiene guardado el cliente
+    etag, weak = response.get_etag()
+    if not etag:
+        return
+    for candidate in etag_candidates(etag)[1:]:
+        if request.if_none_match.contains(candidate):
+            response.set_etag(candidate, weak)
+            return
+
+
+def _compressor(encoding, config):
+    if encoding == 'br':
+        return _BrotliCompressor(config['COMPRESS_BROTLI_QUALITY'])
+    return _GzipCompressor(config['COMPRESS_LEVEL'])
+
+
+def _compress_stream(chunks, compressor, flush_size):
+    pending = 0
+    try:
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            data = compressor.compress(chunk)
+            pending += len(chunk)
+            # Se vacía el buffer cada tanto para que el cliente reciba datos sin esperar al final
+            if pending >= flush_size:
+                data += compressor.sync()
+                pending = 0
+            if data:
+                yield data
+        yield compressor.flush()
+    finally:
+        close = getattr(chunks, 'close', None)
+        if close is not None:
+            close()
+
+
+class _GzipCompressor:
+    def __init__(self, level):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data):
+        return self._compressor.compress(data)
+
+    def sync(self):
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def flush(self):
+        return self._compressor.flush()
+
+
+class _BrotliCompressor:
+    def __init__(self, quality):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data):
+        return self._compressor.process(data)
+
+    def sync(self):
+        return self._compressor.flush()
+
+    def flush(self):
+        return self._compressor.finish()
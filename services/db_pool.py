@@ -0,0 +1,122 @@
+import os
+import threading
+import time
+import weakref
+from sqlalchemy import exc, text
+from sqlalchemy.pool import QueuePool
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool que registra cuánto espera cada checkout y cuántos vencen por timeout."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            with self._stats_lock:
+                self.checkouts += 1
+                self.wait_total += waited
+                self.wait_max = max(self.wait_max, waited)
+
+
+def engine_options(config):
+    options = {'pool_pre_ping': config['DB_POOL_PRE_PING']}
+    # SQLite usa el pool que elige Flask-SQLAlchemy
+    if not (config['SQLALCHEMY_DATABASE_URI'] or '').startswith('sqlite'):
+        options.update(
+            poolclass=TimedQueuePool,
+            pool_size=config['DB_POOL_SIZE'],
+            max_overflow=config['DB_POOL_MAX_OVERFLOW'],
+            pool_timeout=config['DB_POOL_TIMEOUT'],
+            pool_recycle=config['DB_POOL_RECYCLE'],
+        )
+    return options
+
+
+# app -> db de cada aplicación creada en este proceso, para soltar sus pools después de un fork
+_apps = weakref.WeakKeyDictionary()
+
+
+def init_pool(app, db):
+    """
+    Con gunicorn --preload la app se crea antes del fork y los workers
+    heredarían los mismos sockets abiertos. Después del fork cada hijo
+    descarta los pools heredados (sin cerrarlos: siguen siendo del padre) y,
+    si DB_POOL_WARMUP está configurado, abre los suyos antes de empezar a
+    atender requests.
+    """
+    _apps[app] = db
+    _warm_up(app, db)
+
+
+def _warm_up(app, db):
+    count = app.config['DB_POOL_WARMUP']
+    if not count:
+        return
+    with app.app_context():
+        try:
+            warm_up_pool(db.engine, count)
+        except Exception as e:
+            app.logger.warning('No se pudo precalentar el pool de conexiones: %s', e)
+
+
+def _dispose_inherited_pools():
+    for app, db in list(_apps.items()):
+        with app.app_context():
+            for engine in db.engines.values():
+                engine.dispose(close=False)
+        # Corre en el hijo apenas después del fork, antes de que gunicorn lo ponga a atender
+        _warm_up(app, db)
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_dispose_inherited_pools)
+
+
+def warm_up_pool(engine, count):
+    """Abre `count` conexiones y las devuelve al pool para que los primeros requests no paguen el connect."""
+    connections = []
+    try:
+        for _ in range(count):
+            connection = engine.connect()
+            connection.execute(text('SELECT 1'))
+            connections.append(connection)
+    finally:
+        for connection in connections:
+            connection.close()
+    return len(connections)
+
+
+def pool_status(engine):
+    pool = engine.pool
+    status = {'class': type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    if isinstance(pool, TimedQueuePool):
+        with pool._stats_lock:
+            status.update(
+                checkouts=pool.checkouts,
+                timeouts=pool.timeouts,
+                wait_avg_ms=round(pool.wait_total / pool.checkouts * 1000, 3) if pool.checkouts else 0,
+                wait_max_ms=round(pool.wait_max * 1000, 3),
+            )
+    return status
@@ -0,0 +1,122 @@
+import itertools
+import threading
+import time
+from flask import g, has_request_context, request, current_app
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event, exc
+
+REPLICA_BIND_PREFIX = 'replica_'
+PRIMARY_PIN_COOKIE = 'db_primary_until'
+READ_ONLY_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+_round_robin = itertools.count()
+_down_until = {}
+_down_lock = threading.Lock()
+
+
+def replica_binds(urls):
+    """Arma SQLALCHEMY_BINDS a partir de una lista de URLs separadas por coma."""
+    urls = [url.strip() for url in (urls or '').split(',') if url.strip()]
+    return {f'{REPLICA_BIND_PREFIX}{i}': url for i, url in enumerate(urls)}
+
+
+class RoutingSession(Session):
+    """
+    Session que envía las lecturas de requests GET/HEAD a una réplica
+    (round-robin) y todo lo demás al primario. Los flush, INSERT/UPDATE/DELETE
+    y los clientes que escribieron hace poco siempre van al primario. Si la
+    réplica no responde, la consulta se repite en el primario en el mismo
+    request.
+    """
+
+    def execute(self, statement, *args, **kwargs):
+        try:
+            return super().execute(statement, *args, **kwargs)
+        except exc.DBAPIError as e:
+            if not self._fall_back_to_primary(e):
+                raise
+            return super().execute(statement, *args, **kwargs)
+
+    def _fall_back_to_primary(self, error):
+        key = g.get('db_replica') if has_request_context() else None
+        # _replica_error_handler ya la marcó caída si fue un error de conexión
+        if not key or not replica_down(key):
+            return False
+        current_app.logger.warning('Réplica %s caída, se repite la consulta en el primario: %s', key, error.orig)
+        self.rollback()
+        g.db_replica = None
+        return True
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None:
+            if self._flushing or getattr(clause, 'is_dml', False):
+                if has_request_context():
+                    g.db_wrote = True
+            else:
+                engine = request_replica(self._db)
+                if engine is not None:
+                    return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def request_replica(db):
+    if not has_request_context() or request.method not in READ_ONLY_METHODS:
+        return None
+
+    if 'db_replica' not in g:
+        g.db_replica = None if pinned_to_primary() else choose_replica(db)
+    return db.engines[g.db_replica] if g.db_replica else None
+
+
+def choose_replica(db):
+    now = time.monotonic()
+    with _down_lock:
+        available = sorted(
+            key for key in db.engines
+            if key and key.startswith(REPLICA_BIND_PREFIX) and _down_until.get(key, 0) <= now
+        )
+    if not available:
+        return None
+    return available[next(_round_robin) % len(available)]
+
+
+def replica_down(key):
+    with _down_lock:
+        return _down_until.get(key, 0) > time.monotonic()
+
+
+def pinned_to_primary():
+    try:
+        return float(request.cookies.get(PRIMARY_PIN_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+def init_replica_routing(app, db):
+    with app.app_context():
+        for key, engine in db.engines.items():
+            if key and key.startswith(REPLICA_BIND_PREFIX):
+                event.listen(engine, 'handle_error', _replica_error_handler(key, app.config['DB_REPLICA_RETRY_AFTER']))
+
+    @app.after_request
+    def pin_writer_to_primary(response):
+        # Después de escribir, el cliente lee del primario hasta que las réplicas lo alcancen
+        window = current_app.config['DB_PRIMARY_PIN_SECONDS']
+        if window and g.get('db_wrote') and response.status_code < 400:
+            response.set_cookie(
+                PRIMARY_PIN_COOKIE,
+                str(time.time() + window),
+                max_age=window,
+                httponly=True,
+                samesite='Lax',
+            )
+        return response
+
+
+def _replica_error_handler(key, retry_after):
+    def handle_error(context):
+        if context.is_disconnect or context.connection is None:
+            with _down_lock:
+                _down_until[key] = time.monotonic() + retry_after
+            current_app.logger.warning('Réplica %s fuera de servicio por %ss: %s', key, retry_after, context.original_exception)
+    return handle_error
@@ -0,0 +1,67 @@
+import hashlib
+from functools import wraps
+from flask import g, request, current_app, make_response
+from sqlalchemy import select, update
+from extensions import db
+from models import CollectionVersion
+from services.compression import etag_candidates
+
+
+def bump_collection_version(*names):
+    """Incrementa la versión de cada colección dentro de la transacción en curso."""
+    for name in names:
+        result = db.session.execute(
+            update(CollectionVersion)
+            .where(CollectionVersion.name == name)
+            .values(version=CollectionVersion.version + 1)
+        )
+        if result.rowcount == 0:
+            db.session.add(CollectionVersion(name=name, version=1))
+
+
+def collection_versions(names):
+    """Versión actual de cada colección (0 si nunca se escribió); queda en g para el resto del request."""
+    rows = db.session.execute(
+        select(CollectionVersion.name, CollectionVersion.version)
+        .where(CollectionVersion.name.in_(names))
+    ).all()
+    found = dict(rows)
+    versions = {name: found.get(name, 0) for name in names}
+    g.collection_versions = versions
+    return versions
+
+
+def collection_etag(names, variant=None):
+    versions = collection_versions(names)
+    key = '|'.join(f'{name}={versions[name]}' for name in names)
+    raw = f'{key}|{variant}|{request.full_path}'
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def conditional_list(*collections, variant=None):
+    """
+    ETag para listados GET. Si el cliente manda un If-None-Match vigente se
+    responde 304 sin ejecutar la vista.
+
+    variant: función opcional que devuelve lo que cambia el cuerpo según
+    quien consulta (por ejemplo si es admin).
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method != 'GET':
+                return view(*args, **kwargs)
+
+            etag = collection_etag(collections, variant() if variant else None)
+            # El cliente puede tener guardada la variante comprimida (ETag con sufijo -gzip/-br)
+            if any(request.if_none_match.contains(tag) for tag in etag_candidates(etag)):
+                response = current_app.response_class(status=304)
+                response.set_etag(etag)
+                return response
+
+            response = make_response(view(*args, **kwargs))
+            if response.status_code == 200:
+                response.set_etag(etag)
+            return response
+        return wrapper
+    return decorator
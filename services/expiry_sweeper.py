@@ -0,0 +1,110 @@
+import os
+import threading
+import time
+from datetime import date
+from sqlalchemy import select, update
+from extensions import db
+from models import Publication
+from services.etag import bump_collection_version
+from services.feed_snapshot import feed_snapshot
+from services.read_model import refresh_listing
+from services.search_index import publication_search_index
+
+
+def expire_publications(batch_size, pause=0, max_batches=None, today=None, rebuild_snapshot=True):
+    """
+    Pasa a 'inactive' las publicaciones activas con expiry_date anterior a
+    hoy, de a `batch_size` por transacción para no tener filas bloqueadas
+    mucho tiempo. Cada lote se elige por el índice (status, expiry_date) y
+    se vuelve a filtrar en el UPDATE, así que correrlo en paralelo desde
+    varios procesos no hace daño. Devuelve cuántas se desactivaron.
+    """
+    today = today or date.today()
+    expired = (Publication.status == 'active', Publication.expiry_date < today)
+    total = 0
+    batches = 0
+
+    while max_batches is None or batches < max_batches:
+        ids = db.session.execute(
+            select(Publication.id)
+            .where(*expired)
+            .order_by(Publication.expiry_date, Publication.id)
+            .limit(batch_size)
+        ).scalars().all()
+        if not ids:
+            break
+
+        try:
+            result = db.session.execute(
+                update(Publication)
+                .where(Publication.id.in_(ids), *expired)
+                .values(status='inactive')
+                .execution_options(synchronize_session=False)
+            )
+            # El UPDATE masivo no pasa por el flush: publication_listing se actualiza a mano
+            refresh_listing(db.session.connection(), publication_ids=ids)
+            bump_collection_version('publication')
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        for publication_id in ids:
+            publication_search_index.remove(publication_id)
+        total += result.rowcount
+        batches += 1
+        if len(ids) < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+
+    if total and rebuild_snapshot:
+        feed_snapshot.schedule_rebuild()
+    return total
+
+
+class ExpirySweeper:
+    """
+    Corre expire_publications cada EXPIRY_SWEEP_INTERVAL segundos en un
+    thread del worker (0 lo desactiva). El thread se arranca con el primer
+    request de cada proceso, así sobrevive al fork de gunicorn con --preload.
+    """
+
+    def __init__(self):
+        self._app = None
+        self._interval = 0
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self._app = app
+        self._interval = app.config['EXPIRY_SWEEP_INTERVAL']
+        if self._interval > 0:
+            app.before_request(self._ensure_started)
+
+    def _ensure_started(self):
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            threading.Thread(target=self._run, name='expiry-sweeper', daemon=True).start()
+
+    def _run(self):
+        app = self._app
+        while True:
+            with app.app_context():
+                try:
+                    expired = expire_publications(
+                        app.config['EXPIRY_SWEEP_BATCH_SIZE'],
+                        pause=app.config['EXPIRY_SWEEP_PAUSE'],
+                    )
+                    if expired:
+                        app.logger.info('%s publicaciones vencidas pasaron a inactivas', expired)
+                except Exception:
+                    app.logger.exception('Falló el barrido de publicaciones vencidas')
+            time.sleep(self._interval)
+
+
+expiry_sweeper = ExpirySweeper()
@@ -0,0 +1,69 @@
+from collections import Counter
+from decimal import Decimal
+from sqlalchemy import case, func, literal
+from extensions import db
+from models import Publication, Property
+from services.property_filters import filter_properties, parse_value
+
+FACET_COLUMNS = (
+    ('rooms', Property.rooms),
+    ('bathrooms', Property.bathrooms),
+    ('garage_capacity', Property.garage_capacity),
+)
+
+
+def price_bucket(column, edges):
+    """Índice del rango de precio: 0 para < edges[0], len(edges) para >= edges[-1]."""
+    if not edges:
+        return literal(0)
+    return case(
+        *((column < edge, index) for index, edge in enumerate(edges)),
+        else_=len(edges),
+    )
+
+
+def publication_facets(args, edges):
+    """
+    Histogramas de ambientes, baños, cocheras y rango de precio de las
+    publicaciones activas que cumplen los filtros. Se cuentan en un único
+    GROUP BY por la combinación de las cuatro dimensiones y cada histograma
+    sale de sumar esas filas.
+    """
+    bucket = price_bucket(Publication.price_shown, edges)
+    columns = [column for _, column in FACET_COLUMNS]
+
+    query = (
+        db.session.query(*columns, bucket, func.count(Publication.id))
+        .select_from(Publication)
+        .join(Publication.property)
+        .filter(Publication.status == 'active')
+    )
+    query = filter_properties(query, args)
+    if 'price_min' in args:
+        query = query.filter(Publication.price_shown >= parse_value('price_min', args['price_min'], Decimal))
+    if 'price_max' in args:
+        query = query.filter(Publication.price_shown <= parse_value('price_max', args['price_max'], Decimal))
+
+    counts = {name: Counter() for name, _ in FACET_COLUMNS}
+    prices = Counter()
+    total = 0
+    for *values, price_index, count in query.group_by(*columns, bucket):
+        for (name, _), value in zip(FACET_COLUMNS, values):
+            counts[name][value] += count
+        prices[price_index] += count
+        total += count
+
+    facets = {'total': total}
+    for name, counter in counts.items():
+        # Los NULL (por ejemplo sin dato de cochera) van al final
+        facets[name] = [
+            {'value': value, 'count': count}
+            for value, count in sorted(counter.items(), key=lambda item: (item[0] is None, item[0] or 0))
+        ]
+    bounds = [None, *edges, None]
+    facets['price'] = [
+        {'min': bounds[index], 'max': bounds[index + 1], 'count': prices[index]}
+        for index in range(len(edges) + 1)
+        if prices[index]
+    ]
+    return facets
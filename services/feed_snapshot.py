@@ -0,0 +1,213 @@
+import fcntl
+import mmap
+import os
+import struct
+import threading
+import time
+from datetime import date
+from flask import current_app
+from sqlalchemy import select
+from sqlalchemy.orm import contains_eager
+from extensions import db
+from models import Publication
+from schemas import MinimalPublicationSchema
+from services.etag import collection_versions
+from services.pagination import encode_cursor
+from services.serializers import compile_schema
+
+SNAPSHOT_COLLECTIONS = ('publication', 'property', 'image')
+
+# magic, cantidad de publicaciones, inicio de los datos, inicio del índice y versiones de SNAPSHOT_COLLECTIONS
+HEADER = struct.Struct('<8sQQQqqq')
+MAGIC = b'FEEDSNP1'
+# id, publish_date como ordinal (0 si es NULL) y dónde empieza y termina su JSON dentro de los datos
+RECORD = struct.Struct('<qqQQ')
+
+
+def write_snapshot(path, batch_size):
+    """
+    Serializa el feed anónimo completo (mismo orden y mismo JSON que
+    GET /publications) a un archivo nuevo y lo reemplaza con os.replace.
+    Devuelve False si otro proceso ya está generando uno.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    with open(f'{path}.lock', 'w') as lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+
+        # Las versiones se leen antes que los datos: si algo cambia en el medio el snapshot queda viejo, nunca adelantado
+        versions = collection_versions(SNAPSHOT_COLLECTIONS)
+        serialize = compile_schema(MinimalPublicationSchema)
+        dumps = current_app.json.dumps
+        # Mismo separador entre elementos que usa dumps() para la lista entera (',' con orjson, ', ' sin)
+        separator = dumps([0, 0])[2:-2].encode()
+
+        query = (
+            select(Publication)
+            .join(Publication.property)
+            .join(Publication.image)
+            .options(contains_eager(Publication.property), contains_eager(Publication.image))
+            .where(Publication.status == 'active')
+            .order_by(Publication.publish_date.desc(), Publication.id.desc())
+            .execution_options(yield_per=batch_size)
+        )
+
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        index = bytearray()
+        count = 0
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(bytes(HEADER.size))
+                offset = 0
+                for publications in db.session.execute(query).scalars().partitions():
+                    chunk = []
+                    for publication in publications:
+                        item = dumps(serialize(publication)).encode()
+                        ordinal = publication.publish_date.toordinal() if publication.publish_date else 0
+                        index += RECORD.pack(publication.id, ordinal, offset, offset + len(item))
+                        offset += len(item) + len(separator)
+                        chunk.append(item + separator)
+                        count += 1
+                    f.write(b''.join(chunk))
+
+                f.write(index)
+                f.seek(0)
+                f.write(HEADER.pack(
+                    MAGIC, count, HEADER.size, HEADER.size + offset,
+                    *(versions[name] for name in SNAPSHOT_COLLECTIONS),
+                ))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        finally:
+            db.session.rollback()
+    return True
+
+
+class MappedSnapshot:
+    def __init__(self, f, identity):
+        self.identity = identity
+        self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, self._data, self._index, *versions = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            raise ValueError('Snapshot del feed con formato desconocido')
+        self.versions = dict(zip(SNAPSHOT_COLLECTIONS, versions))
+
+    def page(self, after, limit):
+        """(JSON de la página, cursor siguiente) cortando los bytes directamente del archivo."""
+        start = self._position_after(after) if after else 0
+        end = min(start + limit, self.count)
+        if start >= end:
+            return b'[]', None
+
+        first = self._record(start)[2]
+        publication_id, ordinal, _, last = self._record(end - 1)
+        # Los elementos consecutivos ya están separados en el archivo: la página es un único corte
+        payload = b'[' + self._map[self._data + first:self._data + last] + b']'
+
+        next_cursor = None
+        if end < self.count:
+            next_cursor = encode_cursor(date.fromordinal(ordinal) if ordinal else None, publication_id)
+        return payload, next_cursor
+
+    def _record(self, position):
+        return RECORD.unpack_from(self._map, self._index + position * RECORD.size)
+
+    def _position_after(self, after):
+        # Primer elemento estrictamente después del cursor en orden (publish_date, id) descendente
+        publish_date, last_id = after
+        key = (publish_date.toordinal() if publish_date else 0, last_id)
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            publication_id, ordinal, _, _ = self._record(middle)
+            if (ordinal, publication_id) < key:
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+
+class FeedSnapshot:
+    """
+    Snapshot del feed anónimo compartido entre workers: un archivo con el
+    JSON de cada publicación y un índice ordenado por (publish_date, id) que
+    cada proceso mapea en memoria de solo lectura. Se regenera en un thread
+    después de las escrituras y se publica con un rename atómico; los
+    workers vuelven a mapearlo cuando cambia el inode. Si las versiones con
+    las que se generó no coinciden con las actuales no se usa.
+    """
+
+    def __init__(self):
+        self._snapshot = None
+        self._checked = 0
+        self._lock = threading.Lock()
+        self._building = False
+        self._pending = False
+
+    def page(self, after, limit, versions):
+        """Página del snapshot o None si no hay uno vigente (y en ese caso se pide regenerarlo)."""
+        snapshot = self._current()
+        if snapshot is not None and snapshot.versions == versions:
+            return snapshot.page(after, limit)
+        # Si el snapshot está adelantado la réplica de este request todavía no vio la escritura: no hace falta regenerarlo
+        if snapshot is None or any(versions[name] > snapshot.versions[name] for name in SNAPSHOT_COLLECTIONS):
+            self.schedule_rebuild()
+        return None
+
+    def schedule_rebuild(self):
+        if not current_app.config['FEED_SNAPSHOT_PATH']:
+            return
+        with self._lock:
+            self._pending = True
+            if self._building:
+                return
+            self._building = True
+        app = current_app._get_current_object()
+        threading.Thread(target=self._rebuild, args=(app,), name='feed-snapshot', daemon=True).start()
+
+    def _rebuild(self, app):
+        try:
+            while True:
+                with self._lock:
+                    if not self._pending:
+                        return
+                    self._pending = False
+                with app.app_context():
+                    try:
+                        write_snapshot(app.config['FEED_SNAPSHOT_PATH'], app.config['FEED_SNAPSHOT_BATCH_SIZE'])
+                    except Exception:
+                        app.logger.exception('No se pudo generar el snapshot del feed')
+                self._checked = 0
+        finally:
+            with self._lock:
+                self._building = False
+
+    def _current(self):
+        now = time.monotonic()
+        if now - self._checked < current_app.config['FEED_SNAPSHOT_CHECK_INTERVAL']:
+            return self._snapshot
+        self._checked = now
+
+        path = current_app.config['FEED_SNAPSHOT_PATH']
+        try:
+            with open(path, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                identity = (stat.st_ino, stat.st_mtime_ns)
+                if self._snapshot is None or self._snapshot.identity != identity:
+                    # El mapa anterior se libera cuando ningún request lo está usando
+                    self._snapshot = MappedSnapshot(f, identity)
+        except (OSError, ValueError):
+            self._snapshot = None
+        return self._snapshot
+
+
+feed_snapshot = FeedSnapshot()
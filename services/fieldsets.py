@@ -0,0 +1,43 @@
+from marshmallow import fields
+from services.pagination import InvalidQueryParams
+
+
+def parse_fields(args, schema_cls):
+    """
+    Lee el parámetro ?fields=id,title,image.url y lo valida contra los campos
+    del schema. Devuelve None si no se pidió un subconjunto.
+    """
+    raw = args.get('fields')
+    if not raw:
+        return None
+
+    requested = frozenset(name.strip() for name in raw.split(',') if name.strip())
+    declared = schema_cls._declared_fields
+    for name in requested:
+        head, _, tail = name.partition('.')
+        field = declared.get(head)
+        if field is None:
+            raise InvalidQueryParams(f"Campo desconocido '{name}'")
+        if tail:
+            nested = field.nested if isinstance(field, fields.Nested) else None
+            if not isinstance(nested, type) or tail not in nested._declared_fields:
+                raise InvalidQueryParams(f"Campo desconocido '{name}'")
+    return requested or None
+
+
+def load_only_columns(model, only, prefix=None, always=('id',)):
+    """
+    Columnas de `model` que hacen falta para serializar `only`; con `prefix`
+    se toman las del Nested con ese nombre. None significa "todas".
+    """
+    if only is None:
+        return None
+    if prefix:
+        if prefix in only:
+            return None
+        names = {name.split('.', 1)[1] for name in only if name.startswith(f'{prefix}.')}
+    else:
+        names = {name for name in only if '.' not in name}
+
+    columns = model.__mapper__.column_attrs.keys()
+    return [getattr(model, name) for name in sorted(names | set(always)) if name in columns]
@@ -0,0 +1,189 @@
+import glob
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from flask import g, request
+from services.query_stats import current_query_stats
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+METRICS_HELP = {
+    'http_requests_total': ('counter', 'Requests atendidos por endpoint y código de estado'),
+    'http_request_duration_seconds': ('histogram', 'Latencia de los requests en segundos'),
+    'http_requests_in_flight': ('gauge', 'Requests en curso'),
+    'http_request_db_duration_seconds': ('histogram', 'Tiempo de base de datos por request en segundos'),
+    'http_request_db_queries_total': ('counter', 'Consultas SQL ejecutadas'),
+}
+
+
+class MetricsRegistry:
+    """
+    Métricas del proceso actual. Si METRICS_DIR está configurado cada worker
+    vuelca su snapshot a un archivo propio y /metrics suma los de todos; los
+    gauges solo se suman de procesos que siguen vivos.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = defaultdict(float)
+        self._gauges = defaultdict(float)
+        self._histograms = {}
+        self._directory = None
+        self._flush_interval = 5
+        self._last_flush = 0
+
+    def init_app(self, app):
+        self._directory = app.config['METRICS_DIR']
+        self._flush_interval = app.config['METRICS_FLUSH_INTERVAL']
+        if self._directory:
+            os.makedirs(self._directory, exist_ok=True)
+        app.before_request(self._start_request)
+        app.after_request(self._finish_request)
+        app.teardown_request(self._teardown_request)
+
+    def inc(self, name, labels, value=1):
+        with self._lock:
+            self._counters[(name, labels)] += value
+
+    def add_gauge(self, name, labels, value):
+        with self._lock:
+            self._gauges[(name, labels)] += value
+
+    def observe(self, name, labels, value):
+        with self._lock:
+            histogram = self._histograms.get((name, labels))
+            if histogram is None:
+                histogram = self._histograms[(name, labels)] = [0] * (len(LATENCY_BUCKETS) + 2)
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if value <= bound:
+                    histogram[i] += 1
+            histogram[-2] += value
+            histogram[-1] += 1
+
+    def render(self):
+        if not self._directory:
+            return render_snapshots([self.snapshot()])
+
+        self.flush()
+        snapshots = []
+        for path in glob.glob(os.path.join(self._directory, 'metrics_*.json')):
+            try:
+                with open(path) as f:
+                    snapshot = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if not pid_alive(snapshot['pid']):
+                snapshot['gauges'] = []
+            snapshots.append(snapshot)
+        return render_snapshots(snapshots)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'pid': os.getpid(),
+                'counters': [[name, list(labels), value] for (name, labels), value in self._counters.items()],
+                'gauges': [[name, list(labels), value] for (name, labels), value in self._gauges.items()],
+                'histograms': [[name, list(labels), list(values)] for (name, labels), values in self._histograms.items()],
+            }
+
+    def flush(self):
+        path = os.path.join(self._directory, f'metrics_{os.getpid()}.json')
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.snapshot(), f)
+        os.replace(tmp_path, path)
+        self._last_flush = time.monotonic()
+
+    def _start_request(self):
+        g.metrics_start = time.perf_counter()
+        g.metrics_blueprint = request.blueprint or ''
+        self.add_gauge('http_requests_in_flight', (('blueprint', g.metrics_blueprint),), 1)
+
+    def _finish_request(self, response):
+        start = g.get('metrics_start')
+        if start is None:
+            return response
+
+        endpoint = (('blueprint', g.metrics_blueprint), ('endpoint', request.endpoint or 'unknown'))
+        method = (('method', request.method),)
+        self.inc('http_requests_total', endpoint + method + (('status', str(response.status_code)),))
+        self.observe('http_request_duration_seconds', endpoint + method, time.perf_counter() - start)
+
+        stats = current_query_stats()
+        if stats is not None:
+            self.observe('http_request_db_duration_seconds', endpoint, stats.duration)
+            self.inc('http_request_db_queries_total', endpoint, stats.count)
+        return response
+
+    def _teardown_request(self, exc):
+        if g.get('metrics_start') is None:
+            return
+        self.add_gauge('http_requests_in_flight', (('blueprint', g.metrics_blueprint),), -1)
+        if self._directory and time.monotonic() - self._last_flush > self._flush_interval:
+            self.flush()
+
+
+def pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def render_snapshots(snapshots):
+    counters = defaultdict(float)
+    gauges = defaultdict(float)
+    histograms = {}
+    for snapshot in snapshots:
+        for name, labels, value in snapshot['counters']:
+            counters[(name, tuple(map(tuple, labels)))] += value
+        for name, labels, value in snapshot['gauges']:
+            gauges[(name, tuple(map(tuple, labels)))] += value
+        for name, labels, values in snapshot['histograms']:
+            key = (name, tuple(map(tuple, labels)))
+            if key in histograms:
+                histograms[key] = [a + b for a, b in zip(histograms[key], values)]
+            else:
+                histograms[key] = list(values)
+
+    lines = []
+    for name, (metric_type, help_text) in METRICS_HELP.items():
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {metric_type}')
+        for (metric, labels), value in sorted(counters.items()):
+            if metric == name:
+                lines.append(f'{name}{format_labels(labels)} {format_value(value)}')
+        for (metric, labels), value in sorted(gauges.items()):
+            if metric == name:
+                lines.append(f'{name}{format_labels(labels)} {format_value(value)}')
+        for (metric, labels), values in sorted(histograms.items()):
+            if metric != name:
+                continue
+            for bound, count in zip(LATENCY_BUCKETS, values):
+                lines.append(f'{name}_bucket{format_labels(labels + (("le", str(bound)),))} {count}')
+            lines.append(f'{name}_bucket{format_labels(labels + (("le", "+Inf"),))} {values[-1]}')
+            lines.append(f'{name}_sum{format_labels(labels)} {format_value(values[-2])}')
+            lines.append(f'{name}_count{format_labels(labels)} {values[-1]}')
+    return '\n'.join(lines) + '\n'
+
+
+def format_labels(labels):
+    if not labels:
+        return ''
+    pairs = ','.join(
+        '{}="{}"'.format(key, value.replace('\\', '\\\\').replace('"', '\\"'))
+        for key, value in labels
+    )
+    return '{' + pairs + '}'
+
+
+def format_value(value):
+    return repr(int(value)) if float(value).is_integer() else repr(value)
+
+
+metrics = MetricsRegistry()
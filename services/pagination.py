@@ -0,0 +1,78 @@
+import base64
+import json
+from datetime import date
+from decimal import Decimal
+from sqlalchemy import and_, or_
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class InvalidQueryParams(ValueError):
+    pass
+
+
+def parse_limit(args, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    raw = args.get('limit')
+    if raw is None:
+        return default
+    try:
+        limit = int(raw)
+    except ValueError:
+        raise InvalidQueryParams("El parámetro 'limit' debe ser un entero")
+    if limit < 1:
+        raise InvalidQueryParams("El parámetro 'limit' debe ser mayor a 0")
+    return min(limit, maximum)
+
+
+def encode_cursor(value, last_id):
+    """Serializa la clave (valor de orden, id) del último elemento de la página."""
+    if isinstance(value, date):
+        value = value.isoformat()
+    elif isinstance(value, Decimal):
+        value = str(value)
+    payload = json.dumps([value, last_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token):
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        value, last_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise InvalidQueryParams("Cursor inválido")
+    if not isinstance(last_id, int):
+        raise InvalidQueryParams("Cursor inválido")
+    return value, last_id
+
+
+def keyset_order(column, id_column, descending=True):
+    if descending:
+        return column.desc(), id_column.desc()
+    return column.asc(), id_column.asc()
+
+
+def keyset_filter(column, id_column, value, last_id, descending=True):
+    """
+    Condición "después de (value, last_id)" para una página ordenada por
+    (column, id_column). MySQL y SQLite ordenan los NULL como el menor valor,
+    así que van al final en orden descendente y al principio en ascendente.
+    """
+    if descending:
+        if value is None:
+            return and_(column.is_(None), id_column < last_id)
+        return or_(
+            column < value,
+            and_(column == value, id_column < last_id),
+            column.is_(None),
+        )
+
+    if value is None:
+        return or_(
+            and_(column.is_(None), id_column > last_id),
+            column.isnot(None),
+        )
+    return or_(
+        column > value,
+        and_(column == value, id_column > last_id),
+    )
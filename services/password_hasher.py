@@ -0,0 +1,88 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from flask import jsonify
+from werkzeug.security import generate_password_hash, check_password_hash
+
+
+class HasherBusy(Exception):
+    pass
+
+
+def server_busy():
+    """Respuesta para cuando se levanta HasherBusy."""
+    return jsonify({
+        "message": 'Servidor ocupado, intenta nuevamente',
+    }), 503, {'Retry-After': '1'}
+
+
+def _hash(password):
+    return generate_password_hash(password=password, method='pbkdf2', salt_length=8)
+
+
+def _verify(pwhash, password):
+    return check_password_hash(pwhash=pwhash, password=password)
+
+
+class PasswordHasher:
+    """
+    Ejecuta el PBKDF2 en un pool de procesos para no ocupar el worker ni el
+    GIL. La cantidad de hashes en curso o en espera está acotada: si no hay
+    lugar dentro de PASSWORD_HASH_QUEUE_TIMEOUT se lanza HasherBusy.
+    Con PASSWORD_HASH_WORKERS=0 se calcula en el mismo proceso.
+    """
+
+    def __init__(self):
+        self._workers = 0
+        self._slots = None
+        self._queue_timeout = 0
+        self._executor = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self._workers = app.config['PASSWORD_HASH_WORKERS']
+        self._slots = threading.BoundedSemaphore(app.config['PASSWORD_HASH_MAX_PENDING'])
+        self._queue_timeout = app.config['PASSWORD_HASH_QUEUE_TIMEOUT']
+
+    def hash(self, password):
+        return self._run(_hash, password)
+
+    def verify(self, pwhash, password):
+        return self._run(_verify, pwhash, password)
+
+    def _run(self, fn, *args):
+        if not self._workers:
+            return fn(*args)
+
+        if not self._slots.acquire(timeout=self._queue_timeout):
+            raise HasherBusy()
+        try:
+            return self._get_executor().submit(fn, *args).result()
+        except BrokenProcessPool:
+            self._reset_executor()
+            raise
+        finally:
+            self._slots.release()
+
+    def _get_executor(self):
+        # Cada worker de gunicorn crea su propio pool después del fork
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                )
+                self._pid = os.getpid()
+            return self._executor
+
+    def _reset_executor(self):
+        with self._lock:
+            if self._executor is not None and self._pid == os.getpid():
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher()
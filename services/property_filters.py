@@ -0,0 +1,36 @@
+from decimal import Decimal, InvalidOperation
+from models import Property
+from services.pagination import InvalidQueryParams
+
+# Columnas filtrables/ordenables y cómo convertir el valor del query string
+PROPERTY_FILTERS = {
+    'rooms': (Property.rooms, int),
+    'bathrooms': (Property.bathrooms, int),
+    'garage_capacity': (Property.garage_capacity, int),
+    'year_built': (Property.year_built, int),
+    'monthly_rent': (Property.monthly_rent, Decimal),
+}
+
+
+def filter_properties(query, args):
+    for name, (column, convert) in PROPERTY_FILTERS.items():
+        if name in args:
+            query = query.filter(column == parse_value(name, args[name], convert))
+        if f'{name}_min' in args:
+            query = query.filter(column >= parse_value(f'{name}_min', args[f'{name}_min'], convert))
+        if f'{name}_max' in args:
+            query = query.filter(column <= parse_value(f'{name}_max', args[f'{name}_max'], convert))
+
+    if 'active' in args:
+        active = args['active'].lower()
+        if active not in ('true', 'false', '1', '0'):
+            raise InvalidQueryParams("Valor inválido para 'active'")
+        query = query.filter(Property.active == (active in ('true', '1')))
+    return query
+
+
+def parse_value(name, value, convert):
+    try:
+        return convert(value)
+    except (ValueError, TypeError, InvalidOperation):
+        raise InvalidQueryParams(f"Valor inválido para '{name}'")
@@ -0,0 +1,77 @@
+import time
+from collections import Counter
+from flask import g, has_request_context, request, current_app
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryStats:
+    __slots__ = ('count', 'duration', 'statements')
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = Counter()
+
+
+def init_query_stats(app):
+    """
+    Cuenta las consultas SQL y el tiempo de base de datos de cada request.
+    Se exponen en los headers X-DB-Queries y Server-Timing, y se loguea un
+    warning si el endpoint supera su presupuesto o repite la misma consulta
+    (probable N+1).
+    """
+    if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
+
+
+def current_query_stats():
+    return g.get('query_stats') if has_request_context() else None
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info['query_start'].pop()
+    stats = current_query_stats()
+    if stats is not None:
+        stats.count += 1
+        stats.duration += elapsed
+        stats.statements[statement] += 1
+
+
+def _start_request():
+    g.query_stats = QueryStats()
+
+
+def _finish_request(response):
+    stats = current_query_stats()
+    if stats is None:
+        return response
+
+    duration_ms = stats.duration * 1000
+    response.headers['X-DB-Queries'] = str(stats.count)
+    response.headers.add('Server-Timing', f'db;dur={duration_ms:.2f};desc="{stats.count} queries"')
+
+    config = current_app.config
+    endpoint = request.endpoint or request.path
+    budget = config['DB_QUERY_BUDGETS'].get(endpoint, config['DB_QUERY_BUDGET'])
+    if stats.count > budget:
+        current_app.logger.warning(
+            'Presupuesto de consultas excedido en %s: %d consultas (máximo %d), %.2f ms',
+            endpoint, stats.count, budget, duration_ms
+        )
+
+    threshold = config['DB_REPEATED_QUERY_THRESHOLD']
+    for statement, times in stats.statements.items():
+        if times >= threshold:
+            current_app.logger.warning(
+                'Posible N+1 en %s: %d ejecuciones de %s',
+                endpoint, times, ' '.join(statement.split())[:200]
+            )
+    return response
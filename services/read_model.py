@@ -0,0 +1,88 @@
+from itertools import chain
+from sqlalchemy import delete, event, insert, inspect, or_, select
+from models import Publication, Property, Image, PublicationListing
+from services.db_routing import RoutingSession
+
+# Columnas de cada modelo que se copian a publication_listing
+LISTING_SOURCES = {
+    Publication: ('title', 'price_shown', 'status', 'publish_date', 'property_id', 'image_id'),
+    Property: ('address', 'rooms', 'bathrooms'),
+    Image: ('url',),
+}
+
+LISTING_COLUMNS = (
+    'publication_id', 'property_id', 'image_id', 'title', 'price_shown',
+    'address', 'rooms', 'bathrooms', 'image_url', 'status', 'publish_date',
+)
+
+
+def init_read_model():
+    """
+    Mantiene publication_listing al día: después de cada flush se vuelven a
+    copiar las filas de las publicaciones, propiedades o imágenes que
+    cambiaron alguna columna del listado, dentro de la misma transacción.
+    """
+    if not event.contains(RoutingSession, 'after_flush', _sync_listing):
+        event.listen(RoutingSession, 'after_flush', _sync_listing)
+
+
+def listing_select():
+    return (
+        select(
+            Publication.id, Publication.property_id, Publication.image_id, Publication.title,
+            Publication.price_shown, Property.address, Property.rooms, Property.bathrooms,
+            Image.url, Publication.status, Publication.publish_date,
+        )
+        .join(Property, Property.id == Publication.property_id)
+        .join(Image, Image.id == Publication.image_id)
+    )
+
+
+def refresh_listing(connection, publication_ids=(), property_ids=(), image_ids=()):
+    """Vuelve a copiar las filas afectadas (borrar + INSERT ... SELECT, igual en MySQL y SQLite)."""
+    listing = PublicationListing.__table__
+    conditions = []
+    listing_conditions = []
+    for ids, column, listing_column in (
+        (publication_ids, Publication.id, listing.c.publication_id),
+        (property_ids, Publication.property_id, listing.c.property_id),
+        (image_ids, Publication.image_id, listing.c.image_id),
+    ):
+        if ids:
+            conditions.append(column.in_(ids))
+            listing_conditions.append(listing_column.in_(ids))
+    if not conditions:
+        return
+
+    connection.execute(delete(listing).where(or_(*listing_conditions)))
+    connection.execute(insert(listing).from_select(LISTING_COLUMNS, listing_select().where(or_(*conditions))))
+
+
+def rebuild_listing(connection):
+    """Regenera la tabla entera; para cargas que no pasan por el ORM (seed-bulk)."""
+    listing = PublicationListing.__table__
+    connection.execute(delete(listing))
+    connection.execute(insert(listing).from_select(LISTING_COLUMNS, listing_select()))
+
+
+def _sync_listing(session, flush_context):
+    changed = {model: set() for model in LISTING_SOURCES}
+    for obj in chain(session.new, session.dirty):
+        fields = LISTING_SOURCES.get(type(obj))
+        if fields is None:
+            continue
+        # Una propiedad o imagen nueva todavía no tiene publicaciones
+        if obj in session.new:
+            if type(obj) is Publication:
+                changed[Publication].add(obj.id)
+            continue
+        state = inspect(obj)
+        if any(state.attrs[field].history.has_changes() for field in fields):
+            changed[type(obj)].add(obj.id)
+
+    refresh_listing(
+        session.connection(),
+        publication_ids=changed[Publication],
+        property_ids=changed[Property],
+        image_ids=changed[Image],
+    )
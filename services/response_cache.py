@@ -0,0 +1,56 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class ResponseCache:
+    """
+    Cache en memoria del proceso para respuestas ya serializadas.
+
+    Cuando una entrada vence solo un request la reconstruye; los demás
+    siguen sirviendo la versión anterior mientras tanto, o esperan si
+    todavía no existe ninguna. No hay invalidación local: quien la usa
+    incluye en la clave las versiones de CollectionVersion, así una
+    escritura hecha en cualquier worker cambia la clave en todos y las
+    entradas viejas salen por LRU.
+    """
+
+    def __init__(self, max_entries=256, lock_stripes=32):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._build_locks = [threading.Lock() for _ in range(lock_stripes)]
+        self._max_entries = max_entries
+
+    def get_or_build(self, key, builder, ttl):
+        entry = self._get(key)
+        if entry and entry[1] > time.monotonic():
+            return entry[0]
+
+        build_lock = self._build_locks[hash(key) % len(self._build_locks)]
+        if entry and not build_lock.acquire(blocking=False):
+            # Otro request ya la está reconstruyendo
+            return entry[0]
+        if not entry:
+            build_lock.acquire()
+
+        try:
+            entry = self._get(key)
+            if entry and entry[1] > time.monotonic():
+                return entry[0]
+
+            value = builder()
+            with self._lock:
+                self._entries[key] = (value, time.monotonic() + ttl)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+            return value
+        finally:
+            build_lock.release()
+
+    def _get(self, key):
+        with self._lock:
+            return self._entries.get(key)
+
+
+publication_feed_cache = ResponseCache()
@@ -0,0 +1,164 @@
+import math
+import re
+import threading
+import time
+import unicodedata
+from collections import Counter
+from flask import current_app
+from sqlalchemy import select
+from werkzeug.local import LocalProxy
+from extensions import db
+from models import Publication
+
+TOKEN_RE = re.compile(r'\w+')
+
+STOPWORDS = frozenset('''
+a al algo ante con contra cual de del desde donde e el ella en entre es esa ese eso esta este esto
+hasta la las le les lo los mas me mi muy ni no o para pero por que se si sin sobre su sus
+tambien un una uno unos y ya
+'''.split())
+
+# El título pesa más que la descripción
+TITLE_WEIGHT = 2
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def fold(text):
+    """Minúsculas y sin tildes ni diéresis: 'Jardín' y 'jardin' son el mismo término."""
+    decomposed = unicodedata.normalize('NFKD', text.lower())
+    return ''.join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def tokenize(text):
+    return [token for token in TOKEN_RE.findall(fold(text or '')) if token not in STOPWORDS]
+
+
+def document_terms(title, description):
+    terms = Counter(tokenize(description))
+    for token in tokenize(title):
+        terms[token] += TITLE_WEIGHT
+    return terms
+
+
+class PublicationSearchIndex:
+    """
+    Índice invertido en memoria de título y descripción de las
+    publicaciones activas, ordenado con BM25. Se arma con la primera
+    búsqueda, se actualiza en el momento con las altas y bajas de este
+    worker y se reconstruye entero cuando vence el TTL para ver las de los
+    demás.
+    """
+
+    def __init__(self):
+        self._postings = {}
+        self._terms = {}
+        self._lengths = None
+        self._total_length = 0
+        self._expires = 0
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+
+    def search(self, query, ttl):
+        """Lista de (score, publication_id) ordenada de mayor a menor score."""
+        self._ensure_loaded(ttl)
+        terms = set(tokenize(query))
+
+        with self._lock:
+            count = len(self._lengths)
+            if not count or not terms:
+                return []
+            average = self._total_length / count
+            scores = Counter()
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for publication_id, frequency in postings.items():
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * self._lengths[publication_id] / average)
+                    scores[publication_id] += idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+
+        return sorted(((score, publication_id) for publication_id, score in scores.items()), reverse=True)
+
+    def warm_up(self, ttl):
+        self._ensure_loaded(ttl)
+
+    def add(self, publication_id, title, description):
+        if self._lengths is None:
+            return
+        with self._lock:
+            self._remove(publication_id)
+            self._add(publication_id, document_terms(title, description))
+
+    def remove(self, publication_id):
+        if self._lengths is None:
+            return
+        with self._lock:
+            self._remove(publication_id)
+
+    def invalidate(self):
+        self._expires = 0
+
+    def _add(self, publication_id, terms):
+        self._total_length += index_document(self._postings, self._terms, self._lengths, publication_id, terms)
+
+    def _remove(self, publication_id):
+        length = self._lengths.pop(publication_id, None)
+        if length is None:
+            return
+        self._total_length -= length
+        for term in self._terms.pop(publication_id):
+            del self._postings[term][publication_id]
+            if not self._postings[term]:
+                del self._postings[term]
+
+    def _ensure_loaded(self, ttl):
+        if self._lengths is not None and self._expires > time.monotonic():
+            return
+        if self._lengths is not None and not self._load_lock.acquire(blocking=False):
+            # Otro request ya lo está reconstruyendo
+            return
+        if self._lengths is None:
+            self._load_lock.acquire()
+        try:
+            if self._lengths is None or self._expires <= time.monotonic():
+                self._load(ttl)
+        finally:
+            self._load_lock.release()
+
+    def _load(self, ttl):
+        rows = db.session.execute(
+            select(Publication.id, Publication.title, Publication.description)
+            .where(Publication.status == 'active')
+        )
+        postings = {}
+        terms_by_id = {}
+        lengths = {}
+        total_length = 0
+        for publication_id, title, description in rows:
+            terms = document_terms(title, description)
+            total_length += index_document(postings, terms_by_id, lengths, publication_id, terms)
+
+        with self._lock:
+            self._postings = postings
+            self._terms = terms_by_id
+            self._lengths = lengths
+            self._total_length = total_length
+            self._expires = time.monotonic() + ttl
+
+
+def index_document(postings, terms_by_id, lengths, publication_id, terms):
+    for term, frequency in terms.items():
+        postings.setdefault(term, {})[publication_id] = frequency
+    terms_by_id[publication_id] = tuple(terms)
+    lengths[publication_id] = sum(terms.values())
+    return lengths[publication_id]
+
+
+def init_search_index(app):
+    """Un índice por app: dos apps en el mismo proceso (por ejemplo en los tests) no comparten documentos."""
+    app.extensions['publication_search_index'] = PublicationSearchIndex()
+
+
+publication_search_index = LocalProxy(lambda: current_app.extensions['publication_search_index'])
@@ -0,0 +1,147 @@
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+from sqlalchemy import func, insert, select
+from werkzeug.security import generate_password_hash
+from extensions import db
+from models import Person, User, Property, Image, Publication, Contract
+from services.etag import bump_collection_version
+from services.read_model import rebuild_listing
+
+FIRST_NAMES = ['Sofía', 'Mateo', 'Valentina', 'Benjamín', 'Martina', 'Joaquín', 'Lucía', 'Tomás', 'Camila', 'Agustín']
+LAST_NAMES = ['González', 'Rodríguez', 'Fernández', 'López', 'Martínez', 'Pérez', 'Gómez', 'Díaz', 'Sánchez', 'Romero']
+STREETS = ['Av. Colón', 'San Martín', 'Belgrano', 'Rivadavia', 'Sarmiento', 'Mitre', 'Av. Vélez Sarsfield', 'Chacabuco']
+CITIES = ['Córdoba', 'Rosario', 'Mendoza', 'La Plata', 'Mar del Plata', 'Salta']
+ADJECTIVES = ['luminoso', 'amplio', 'reciclado', 'a estrenar', 'con balcón', 'con patio', 'céntrico']
+KINDS = ['Departamento', 'Casa', 'Dúplex', 'Monoambiente', 'PH']
+ROOMS = ['living', 'cocina integrada', 'lavadero', 'quincho', 'pileta', 'cochera', 'terraza']
+DEFAULT_PASSWORD = 'password123'
+
+
+def seed_bulk(users=0, properties=0, images=0, publications=0, contracts=0, batch_size=1000, seed=None):
+    """
+    Inserta datos sintéticos con ids a continuación de los existentes. Las
+    propiedades y publicaciones apuntan a usuarios, propiedades e imágenes
+    que existen; las publicaciones y contratos llevan como dueño al de la
+    propiedad, el inquilino es siempre otro usuario y los contratos de una
+    misma propiedad no se superponen.
+    """
+    rng = random.Random(seed)
+    today = date.today()
+    counts = {}
+
+    person_ids = _insert(Person, users, batch_size, lambda i: {
+        'first_name': rng.choice(FIRST_NAMES),
+        'last_name': rng.choice(LAST_NAMES),
+        'date_of_birth': date(1950, 1, 1) + timedelta(days=rng.randrange(20000)),
+    })
+    password = generate_password_hash(DEFAULT_PASSWORD, method='pbkdf2', salt_length=8)
+    user_ids = _insert(User, users, batch_size, lambda i: {
+        'username': f'seed_user_{person_ids[i]}',
+        'email': f'seed_user_{person_ids[i]}@example.com',
+        'password': password,
+        'is_active': True,
+        'is_admin': i % 10 == 0,
+        'person_id': person_ids[i],
+    })
+    counts['user'] = len(user_ids)
+    all_user_ids = user_ids or _existing_ids(User)
+    if (properties or publications or contracts) and not all_user_ids:
+        raise ValueError('Se necesita al menos un usuario para generar propiedades, publicaciones o contratos')
+
+    property_ids = _insert(Property, properties, batch_size, lambda i: {
+        'address': f'{rng.choice(STREETS)} {rng.randrange(1, 5000)}, {rng.choice(CITIES)}',
+        'rooms': rng.randint(1, 6),
+        'bathrooms': rng.randint(1, 4),
+        'garage_capacity': rng.choice([None, 0, 1, 1, 2]),
+        'year_built': rng.choice([None, rng.randint(1940, today.year)]),
+        'property_status_id': 1,
+        'monthly_rent': Decimal(rng.randrange(15000, 300000)) / 100,
+        'owner_id': rng.choice(all_user_ids),
+        'active': rng.random() > 0.05,
+    })
+    counts['property'] = len(property_ids)
+
+    image_ids = _insert(Image, images, batch_size, lambda i: {
+        'name': f'{rng.choice(["Frente", "Living", "Cocina", "Dormitorio", "Baño"])} {i + 1}',
+        'url': f'https://picsum.photos/seed/alquiclick-{i}/800/600',
+    })
+    counts['image'] = len(image_ids)
+
+    all_property_ids = property_ids or _existing_ids(Property)
+    all_image_ids = image_ids or _existing_ids(Image)
+    if publications and not (all_property_ids and all_image_ids):
+        raise ValueError('Se necesitan propiedades e imágenes para generar publicaciones')
+    owners = _property_owners(property_ids) if publications or contracts else {}
+
+    def publication_row(i):
+        publish_date = today - timedelta(days=rng.randrange(365))
+        property_id = rng.choice(all_property_ids)
+        return {
+            'property_id': property_id,
+            'image_id': rng.choice(all_image_ids),
+            'user_id': owners[property_id],
+            'title': f'{rng.choice(KINDS)} {rng.choice(ADJECTIVES)} en {rng.choice(CITIES)}',
+            'description': f'{rng.randint(1, 6)} ambientes con {", ".join(rng.sample(ROOMS, 3))}.',
+            'price_shown': Decimal(rng.randrange(15000, 300000)) / 100,
+            'publication_status_id': 1,
+            'publish_date': publish_date,
+            'expiry_date': publish_date + timedelta(days=rng.choice([30, 60, 90, 180])),
+            'status': 'active' if rng.random() > 0.1 else 'inactive',
+        }
+    counts['publication'] = len(_insert(Publication, publications, batch_size, publication_row))
+
+    if contracts and (not all_property_ids or len(all_user_ids) < 2):
+        raise ValueError('Se necesitan propiedades y al menos dos usuarios para generar contratos')
+    next_start = {}
+
+    def contract_row(i):
+        property_id = rng.choice(all_property_ids)
+        start = next_start.get(property_id, today - timedelta(days=rng.randrange(720)))
+        end = start + timedelta(days=rng.choice([180, 365, 730]))
+        next_start[property_id] = end + timedelta(days=rng.randrange(1, 60))
+        owner_id = owners[property_id]
+        renter_id = owner_id
+        while renter_id == owner_id:
+            renter_id = rng.choice(all_user_ids)
+        return {
+            'property_id': property_id,
+            'renter_id': renter_id,
+            'owner_id': owner_id,
+            'start_date': start,
+            'end_date': end,
+            'monthly_rent': Decimal(rng.randrange(15000, 300000)) / 100,
+            'status': True,
+        }
+    counts['contract'] = len(_insert(Contract, contracts, batch_size, contract_row))
+
+    # Los INSERT de Core no pasan por los eventos del ORM
+    if counts['publication']:
+        rebuild_listing(db.session.connection())
+    bump_collection_version(*[name for name, count in counts.items() if count])
+    db.session.commit()
+    return counts
+
+
+def _insert(model, count, batch_size, make_row):
+    if not count:
+        return []
+    first_id = (db.session.execute(select(func.max(model.id))).scalar() or 0) + 1
+    ids = list(range(first_id, first_id + count))
+    for start in range(0, count, batch_size):
+        rows = [dict(make_row(i), id=ids[i]) for i in range(start, min(start + batch_size, count))]
+        db.session.execute(insert(model.__table__), rows)
+        db.session.commit()
+    return ids
+
+
+def _property_owners(property_ids):
+    """property_id -> owner_id de las propiedades recién generadas, o de todas si no se generaron."""
+    query = select(Property.id, Property.owner_id)
+    if property_ids:
+        query = query.where(Property.id.between(property_ids[0], property_ids[-1]))
+    return dict(db.session.execute(query).all())
+
+
+def _existing_ids(model):
+    return db.session.execute(select(model.id)).scalars().all()
@@ -0,0 +1,58 @@
+from decimal import Decimal
+from functools import lru_cache
+from marshmallow import fields
+
+
+def dump_many(schema_cls, objs, only=None):
+    """Equivalente a schema_cls(only=only).dump(objs, many=True) usando el serializador compilado."""
+    serialize = compile_schema(schema_cls, frozenset(only) if only else None)
+    return [serialize(obj) for obj in objs]
+
+
+# Acotada: `only` sale del ?fields= del cliente y cada combinación distinta es una entrada
+@lru_cache(maxsize=128)
+def compile_schema(schema_cls, only=None):
+    """
+    Arma una función obj -> dict con la misma salida que el dump de
+    marshmallow, resolviendo una sola vez el tipo de cada campo. Los tipos
+    que no se reconocen delegan en field.serialize().
+    """
+    schema = schema_cls(only=only)
+    plan = [
+        (name, field.attribute or name, field.data_key or name, field, _field_serializer(field))
+        for name, field in schema.dump_fields.items()
+    ]
+
+    def serialize(obj):
+        # Los atributos ya cargados están en __dict__; leerlos de ahí evita el descriptor del ORM
+        loaded = getattr(obj, '__dict__', {})
+        result = {}
+        for name, attribute, key, field, convert in plan:
+            if convert is None:
+                result[key] = field.serialize(name, obj)
+                continue
+            value = loaded[attribute] if attribute in loaded else getattr(obj, attribute)
+            result[key] = None if value is None else convert(value)
+        return result
+
+    return serialize
+
+
+def _field_serializer(field):
+    if isinstance(field, fields.Nested) and not field.many:
+        nested = field.schema
+        serialize_nested = compile_schema(type(nested), frozenset(nested.only) if nested.only else None)
+        return serialize_nested
+    if isinstance(field, fields.Decimal) and field.places is None:
+        if field.as_string:
+            return lambda value: format(value if isinstance(value, Decimal) else Decimal(str(value)), 'f')
+        return lambda value: value if isinstance(value, Decimal) else Decimal(str(value))
+    if isinstance(field, fields.Integer) and not field.as_string:
+        return int
+    if isinstance(field, fields.String):
+        return str
+    if type(field) is fields.Date and field.format in (None, 'iso'):
+        return lambda value: value.isoformat()
+    if isinstance(field, fields.Boolean):
+        return lambda value: value if value is True or value is False else field._serialize(value, None, None)
+    return None
@@ -0,0 +1,109 @@
+import hashlib
+import importlib.util
+import json
+import os
+from flask import Blueprint, Response, current_app, request
+
+SPEC_ENDPOINT = 'apispec_1'
+
+DOCS_PAGE = """<!DOCTYPE html>
+<html lang="en">
+  <head>
+    <meta charset="UTF-8">
+    <title>Flasgger</title>
+    <link rel="stylesheet" type="text/css" href="/flasgger_static/swagger-ui.css">
+    <link rel="icon" type="image/png" href="/flasgger_static/favicon-32x32.png">
+  </head>
+  <body>
+    <div id="swagger-ui"></div>
+    <script src="/flasgger_static/swagger-ui-bundle.js"></script>
+    <script src="/flasgger_static/swagger-ui-standalone-preset.js"></script>
+    <script>
+      window.ui = SwaggerUIBundle({
+        url: "/apispec_1.json",
+        dom_id: "#swagger-ui",
+        deepLinking: true,
+        presets: [SwaggerUIBundle.presets.apis, SwaggerUIStandalonePreset],
+        layout: "StandaloneLayout"
+      });
+    </script>
+  </body>
+</html>
+"""
+
+
+def build_spec(app):
+    """Genera el spec OpenAPI desde los docstrings de las vistas (importa flasgger)."""
+    from flasgger import Swagger
+
+    if 'auth' not in app.blueprints:
+        # App creada sin vistas (manage.py): se registran solo para leer sus docstrings
+        from views import register_bp
+        register_bp(app)
+
+    swagger = app.extensions.get('swagger')
+    if swagger is None:
+        swagger = Swagger(app)
+    with app.test_request_context():
+        return swagger.get_apispecs(SPEC_ENDPOINT)
+
+
+def write_spec(app, path):
+    spec = build_spec(app)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(spec, f, sort_keys=True, separators=(',', ':'))
+    os.replace(tmp_path, path)
+    return spec
+
+
+def init_swagger(app):
+    """
+    SWAGGER_MODE=dynamic usa flasgger y arma el spec en el primer request de
+    cada worker. Con static se sirve el JSON generado por `flask swagger-build`
+    sin importar flasgger, y con off no se expone la documentación.
+    """
+    mode = app.config['SWAGGER_MODE']
+    if mode == 'dynamic':
+        from flasgger import Swagger
+        app.extensions['swagger'] = Swagger(app)
+    elif mode == 'static':
+        app.register_blueprint(static_docs_blueprint(app.config['SWAGGER_SPEC_FILE']))
+
+
+def static_docs_blueprint(spec_file):
+    # Los assets de Swagger UI vienen con flasgger; se ubican sin importar el paquete
+    flasgger_spec = importlib.util.find_spec('flasgger')
+    static_folder = None
+    if flasgger_spec and flasgger_spec.submodule_search_locations:
+        static_folder = os.path.join(flasgger_spec.submodule_search_locations[0], 'ui3', 'static')
+
+    bp = Blueprint('swagger_static', __name__, static_folder=static_folder, static_url_path='/flasgger_static')
+    cached = {}
+
+    @bp.route(f'/{SPEC_ENDPOINT}.json')
+    def apispec():
+        try:
+            mtime = os.stat(spec_file).st_mtime_ns
+            if cached.get('mtime') != mtime:
+                with open(spec_file, 'rb') as f:
+                    body = f.read()
+                cached.update(mtime=mtime, body=body, etag=hashlib.sha1(body).hexdigest())
+        except OSError:
+            current_app.logger.warning("No existe el spec de Swagger en %s, correr 'flask swagger-build'", spec_file)
+            return current_app.response_class(
+                json.dumps({"message": "Documentación no disponible"}),
+                status=404,
+                mimetype='application/json',
+            )
+
+        response = Response(cached['body'], mimetype='application/json')
+        response.set_etag(cached['etag'])
+        return response.make_conditional(request)
+
+    @bp.route('/apidocs/')
+    def apidocs():
+        return Response(DOCS_PAGE, mimetype='text/html')
+
+    return bp
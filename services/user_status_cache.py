@@ -0,0 +1,44 @@
+import threading
+import time
+from sqlalchemy import select
+from extensions import db
+from models import User
+
+
+class UserStatusCache:
+    """
+    Cache en memoria de user id -> (is_active, is_admin, token_version) para
+    validar los JWT sin consultar la base en cada request. Las vistas que
+    modifican usuarios llaman a invalidate(); los demás workers ven el cambio
+    cuando vence el TTL.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id, ttl):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+        if entry and entry[1] > now:
+            return entry[0]
+
+        # Siempre del primario: una réplica atrasada volvería a cachear un token ya revocado
+        row = db.session.execute(
+            select(User.is_active, User.is_admin, User.token_version)
+            .where(User.id == user_id),
+            bind_arguments={'bind': db.engine},
+        ).first()
+        status = tuple(row) if row else None
+
+        with self._lock:
+            self._entries[user_id] = (status, now + ttl)
+        return status
+
+    def invalidate(self, user_id):
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+
+user_status_cache = UserStatusCache()
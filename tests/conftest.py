@@ -0,0 +1,57 @@
+import base64
+from datetime import date, timedelta
+import pytest
+from werkzeug.security import generate_password_hash
+from app import create_app
+from extensions import db
+from models import Person, User, Property, Image, Publication
+
+
+@pytest.fixture
+def app():
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def publications(app):
+    add_publications()
+
+
+def add_publications(title='Casa'):
+    """25 publicaciones activas, cada una con su propiedad e imagen."""
+    db.session.add(Person(id=1, first_name='Ana', last_name='Pérez'))
+    db.session.add(User(
+        id=1, username='admin', email='admin@example.com', person_id=1, is_admin=True,
+        password=generate_password_hash('secret', method='pbkdf2:sha256:1000'),
+    ))
+    for i in range(1, 26):
+        db.session.add(Property(
+            id=i, address=f'Calle {i}', rooms=i % 5 + 1, bathrooms=i % 3 + 1, garage_capacity=i % 2,
+            year_built=1990 + i, monthly_rent=1000 + i, owner_id=1, active=True,
+        ))
+        db.session.add(Image(id=i, name=f'foto {i}', url=f'https://example.com/{i}.jpg'))
+    db.session.flush()
+    for i in range(1, 26):
+        db.session.add(Publication(
+            id=i, property_id=i, image_id=i, user_id=1, title=f'{title} {i}', description='Con jardín',
+            price_shown=1000 + i, publication_status_id=1, publish_date=date(2024, 1, 1) + timedelta(days=i % 7),
+            expiry_date=date(2030, 1, 1), status='active',
+        ))
+    db.session.commit()
+
+
+@pytest.fixture
+def auth_headers(client, publications):
+    credentials = base64.b64encode(b'admin:secret').decode()
+    response = client.post('/login', headers={'Authorization': f'Basic {credentials}'})
+    return {'Authorization': f"Bearer {response.get_json()['token']}"}
@@ -0,0 +1,38 @@
+import pytest
+from sqlalchemy import event
+from extensions import db
+
+
+@pytest.fixture
+def statements(app):
+    """Lista con las sentencias SQL que se ejecutan mientras dura el test."""
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', record)
+    yield executed
+    event.remove(db.engine, 'before_cursor_execute', record)
+
+
+def count_statements(client, statements, url, headers=None):
+    statements.clear()
+    response = client.get(url, headers=headers)
+    assert response.status_code == 200
+    return len(response.get_json()), len(statements)
+
+
+@pytest.mark.parametrize('authenticated', [False, True])
+def test_publication_feed_statements_do_not_grow_with_page_size(
+    client, statements, publications, auth_headers, authenticated
+):
+    headers = auth_headers if authenticated else None
+
+    small, small_statements = count_statements(client, statements, '/publications?limit=2', headers)
+    large, large_statements = count_statements(client, statements, '/publications?limit=20', headers)
+
+    assert (small, large) == (2, 20)
+    # Property e Image vienen en el mismo JOIN: la cantidad de consultas no depende de las filas
+    assert small_statements == large_statements
+    assert large_statements <= 3
@@ -0,0 +1,17 @@
+from app import create_app
+from extensions import db
+from conftest import add_publications
+
+
+def test_search_index_is_not_shared_between_apps(client, publications):
+    assert len(client.get('/publications/search?q=casa').get_json()) == 20
+
+    other = create_app('testing')
+    with other.app_context():
+        db.create_all()
+        add_publications(title='Depto')
+        response = other.test_client().get('/publications/search?q=depto')
+        db.drop_all()
+
+    assert response.status_code == 200
+    assert len(response.get_json()) == 20
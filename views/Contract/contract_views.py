@@ -3,18 +3,24 @@ from flask_jwt_extended import (
     get_jwt,
     jwt_required,
 )
+from sqlalchemy.orm import load_only
 from werkzeug.security import (
     generate_password_hash,
     check_password_hash
 )
-from app import db
+from extensions import db
 from models import User, Contract, Property
 from schemas import ContractSchema
+from services.etag import conditional_list, bump_collection_version
+from services.fieldsets import parse_fields, load_only_columns
+from services.pagination import InvalidQueryParams
+from services.availability_index import contract_interval_index
 
 contract_bp = Blueprint('contract', __name__)
 
 @contract_bp.route("/contract", methods=['POST', 'GET'])
 @jwt_required()
+@conditional_list('contract')
 def contract():
     additional_data = get_jwt()
     admin = additional_data.get('is_admin')
@@ -55,7 +61,9 @@ def contract():
             )
 
             db.session.add(new_contract)
+            bump_collection_version('contract')
             db.session.commit()
+            contract_interval_index.refresh(new_contract.property_id)
 
             return jsonify({
                 "message": f"Contract created successfully",
@@ -68,5 +76,13 @@ def contract():
                 "error": str(e)
             }), 500
 
-    contracts = Contract.query.all()
-    return ContractSchema().dump(contracts, many=True)
\ No newline at end of file
+    try:
+        only = parse_fields(request.args, ContractSchema)
+    except InvalidQueryParams as e:
+        return jsonify({"message": str(e)}), 400
+
+    query = Contract.query
+    columns = load_only_columns(Contract, only)
+    if columns is not None:
+        query = query.options(load_only(*columns))
+    return ContractSchema(only=only).dump(query.all(), many=True)
\ No newline at end of file
@@ -0,0 +1,127 @@
+import csv
+import io
+import json
+from datetime import date
+from decimal import Decimal
+from flask import Blueprint, request, jsonify, current_app, stream_with_context
+from flask_jwt_extended import get_jwt, jwt_required
+from sqlalchemy import select
+from extensions import db
+from models import Property, Publication, Contract
+
+export_bp = Blueprint('export', __name__)
+
+EXPORT_TABLES = {
+    'property': Property.__table__,
+    'publications': Publication.__table__,
+    'contract': Contract.__table__,
+}
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+@export_bp.route("/export/<string:collection>", methods=['GET'])
+@jwt_required()
+def export_collection(collection):
+    """
+    Stream a full table export as NDJSON or CSV (Admin only)
+    ---
+    security:
+      - Bearer: []
+    parameters:
+      - name: Authorization
+        in: header
+        type: string
+        required: true
+        description: "JWT Token with 'Bearer ' prefix"
+      - name: collection
+        in: path
+        type: string
+        required: true
+        enum: [property, publications, contract]
+      - name: format
+        in: query
+        type: string
+        required: false
+        enum: [ndjson, csv]
+        description: "Output format (default ndjson)"
+    responses:
+      200:
+        description: One row per line, ordered by id
+      400:
+        description: Unknown format
+      403:
+        description: Unauthorized action (if not admin)
+        schema:
+          type: object
+          properties:
+            message:
+              type: string
+              example: "No tienes permisos para exportar datos"
+      404:
+        description: Unknown collection
+    """
+    additional_data = get_jwt()
+    admin = additional_data.get('is_admin')
+
+    if not admin:
+        return jsonify({
+            "message": "No tienes permisos para exportar datos"
+        }), 403
+
+    table = EXPORT_TABLES.get(collection)
+    if table is None:
+        return jsonify({"message": f"No se puede exportar '{collection}'"}), 404
+
+    export_format = request.args.get('format', 'ndjson')
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({"message": f"Formato inválido '{export_format}'"}), 400
+
+    rows = stream_rows(table, current_app.config['EXPORT_BATCH_SIZE'])
+    if export_format == 'csv':
+        body = csv_lines(table, rows)
+    else:
+        body = ndjson_lines(rows)
+
+    return current_app.response_class(
+        stream_with_context(body),
+        mimetype=EXPORT_FORMATS[export_format],
+        headers={'Content-Disposition': f'attachment; filename={collection}.{export_format}'},
+    )
+
+def stream_rows(table, batch_size):
+    # yield_per usa un cursor del lado del servidor y trae las filas por lotes
+    result = db.session.execute(
+        select(table).order_by(table.c.id).execution_options(yield_per=batch_size)
+    )
+    for partition in result.mappings().partitions():
+        yield partition
+
+def export_value(value):
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+def ndjson_lines(rows):
+    for partition in rows:
+        yield ''.join(
+            json.dumps({key: export_value(value) for key, value in row.items()}) + '\n'
+            for row in partition
+        )
+
+def csv_lines(table, rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(table.c.keys())
+    for partition in rows:
+        for row in partition:
+            writer.writerow([export_value(value) for value in row.values()])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
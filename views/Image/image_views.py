@@ -1,13 +1,19 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import get_jwt, jwt_required
-from app import db
+from sqlalchemy.orm import load_only
+from extensions import db
 from models import Image
 from schemas import ImageSchema
+from services.etag import conditional_list, bump_collection_version
+from services.serializers import dump_many
+from services.fieldsets import parse_fields, load_only_columns
+from services.pagination import InvalidQueryParams
 
 image_bp = Blueprint('image', __name__)
 
 @image_bp.route("/image", methods=['GET'])
 @jwt_required()
+@conditional_list('image')
 def get_images():
     """
     Retrieve a list of all images
@@ -20,6 +26,11 @@ def get_images():
         type: string
         required: true
         description: "JWT Token with 'Bearer ' prefix"
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: "Comma separated subset of fields to return (e.g. id,url)"
     responses:
       200:
         description: List of images
@@ -38,8 +49,16 @@ def get_images():
                 type: string
                 description: The URL of the image
     """
-    images = Image.query.all()
-    return ImageSchema().dump(images, many=True)
+    try:
+        only = parse_fields(request.args, ImageSchema)
+    except InvalidQueryParams as e:
+        return jsonify({"message": str(e)}), 400
+
+    query = Image.query
+    columns = load_only_columns(Image, only)
+    if columns is not None:
+        query = query.options(load_only(*columns))
+    return dump_many(ImageSchema, query.all(), only)
 
 @image_bp.route("/image", methods=['POST'])
 @jwt_required()
@@ -130,6 +149,7 @@ def create_image():
         )
 
         db.session.add(new_image)
+        bump_collection_version('image')
         db.session.commit()
 
         return jsonify({
@@ -225,6 +245,7 @@ def delete_image():
           }), 404
 
         db.session.delete(image)
+        bump_collection_version('image')
         db.session.commit()
 
         return jsonify({
@@ -0,0 +1,109 @@
+from flask import Blueprint, current_app, jsonify
+from sqlalchemy import text
+from extensions import db
+from services.metrics import metrics
+from services.db_pool import pool_status
+from services.db_routing import REPLICA_BIND_PREFIX
+
+monitoring_bp = Blueprint('monitoring', __name__)
+
+@monitoring_bp.route("/metrics", methods=['GET'])
+def get_metrics():
+    """
+    Prometheus metrics
+    ---
+    produces:
+      - text/plain
+    responses:
+      200:
+        description: Request latency histograms, in-flight gauges, status code counters and DB time per endpoint, in Prometheus text format
+    """
+    return current_app.response_class(
+        metrics.render(),
+        mimetype='text/plain; version=0.0.4'
+    )
+
+@monitoring_bp.route("/health", methods=['GET'])
+def health():
+    """
+    Health check with database connectivity and connection pool usage
+    ---
+    responses:
+      200:
+        description: Service and database are up
+        schema:
+          type: object
+          properties:
+            status:
+              type: string
+              example: "ok"
+              description: "'degraded' when the primary is up but a replica is not"
+            database:
+              type: string
+              example: "ok"
+            pool:
+              type: object
+              properties:
+                size:
+                  type: integer
+                checked_in:
+                  type: integer
+                checked_out:
+                  type: integer
+                overflow:
+                  type: integer
+                checkouts:
+                  type: integer
+                timeouts:
+                  type: integer
+                wait_avg_ms:
+                  type: number
+                wait_max_ms:
+                  type: number
+            replicas:
+              type: object
+              description: Same check and pool usage for each configured read replica
+              additionalProperties:
+                type: object
+                properties:
+                  database:
+                    type: string
+                    example: "ok"
+                  pool:
+                    type: object
+      503:
+        description: Primary database is unreachable
+    """
+    # Cada engine se prueba directo: por la sesión un GET iría a una réplica
+    database = check_database(db.engine)
+    replicas = {
+        key: {"database": check_database(engine), "pool": pool_status(engine)}
+        for key, engine in db.engines.items()
+        if key and key.startswith(REPLICA_BIND_PREFIX)
+    }
+
+    if database != 'ok':
+        status, status_code = 'error', 503
+    elif any(replica['database'] != 'ok' for replica in replicas.values()):
+        status, status_code = 'degraded', 200
+    else:
+        status, status_code = 'ok', 200
+
+    body = {
+        "status": status,
+        "database": database,
+        "pool": pool_status(db.engine),
+    }
+    if replicas:
+        body["replicas"] = replicas
+    return jsonify(body), status_code
+
+def check_database(engine):
+    try:
+        with engine.connect() as connection:
+            connection.execute(text('SELECT 1'))
+        return 'ok'
+    except Exception as e:
+        # El detalle queda en el log; la respuesta es pública
+        current_app.logger.warning('Health check de %s falló: %s', engine.url.render_as_string(hide_password=True), e)
+        return 'unreachable'
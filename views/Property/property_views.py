@@ -1,16 +1,33 @@
-from flask import Blueprint, request, jsonify
+from datetime import date
+from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import get_jwt, jwt_required
-from app import db
-from models import Property
+from sqlalchemy import exists, insert, select, text
+from sqlalchemy.orm import load_only
+from extensions import db
+from models import Property, Contract, User
 from schemas import PropertySchema
+from services.pagination import (
+    InvalidQueryParams,
+    parse_limit,
+    encode_cursor,
+    decode_cursor,
+    keyset_order,
+    keyset_filter,
+)
+from services.etag import conditional_list, bump_collection_version
+from services.serializers import dump_many
+from services.fieldsets import parse_fields, load_only_columns
+from services.availability_index import contract_interval_index, contract_overlaps
+from services.property_filters import PROPERTY_FILTERS, filter_properties, parse_value
 
 property_bp = Blueprint('property', __name__)
 
 @property_bp.route("/property", methods=['GET'])
 @jwt_required()
+@conditional_list('property')
 def get_properties():
     """
-    Retrieve a list of all properties
+    Search properties with exact and range filters, sorted and paginated
     ---
     security:
       - Bearer: []
@@ -20,9 +37,50 @@ def get_properties():
         type: string
         required: true
         description: "JWT Token with 'Bearer ' prefix"
+      - name: rooms
+        in: query
+        type: integer
+        required: false
+        description: "Exact match. rooms_min / rooms_max filter a range; the same applies to bathrooms, garage_capacity, year_built and monthly_rent"
+      - name: monthly_rent_min
+        in: query
+        type: number
+        required: false
+      - name: monthly_rent_max
+        in: query
+        type: number
+        required: false
+      - name: active
+        in: query
+        type: boolean
+        required: false
+      - name: sort
+        in: query
+        type: string
+        required: false
+        description: "id, rooms, bathrooms, garage_capacity, year_built or monthly_rent; prefix with '-' for descending (default id)"
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: "Page size (default 20, max 100)"
+      - name: cursor
+        in: query
+        type: string
+        required: false
+        description: "Opaque cursor taken from the X-Next-Cursor header of the previous page"
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: "Comma separated subset of fields to return (e.g. id,address,monthly_rent)"
     responses:
       200:
         description: List of properties
+        headers:
+          X-Next-Cursor:
+            type: string
+            description: Cursor for the next page, absent on the last page
         schema:
           type: array
           items:
@@ -58,9 +116,212 @@ def get_properties():
               active:
                 type: boolean
                 description: Whether the property is active
+      400:
+        description: Invalid filter, sort or cursor
+        schema:
+          type: object
+          properties:
+            message:
+              type: string
+              example: "Valor inválido para 'rooms_min'"
+    """
+    return search_properties(Property.query)
+
+def search_properties(query):
+    try:
+        query = filter_properties(query, request.args)
+        sort_column, convert, descending = parse_property_sort(request.args.get('sort', 'id'))
+        limit = parse_limit(request.args)
+        only = parse_fields(request.args, PropertySchema)
+        cursor = request.args.get('cursor')
+        if cursor:
+            value, last_id = decode_cursor(cursor)
+            value = parse_value('cursor', value, convert) if value is not None else None
+            query = query.filter(keyset_filter(sort_column, Property.id, value, last_id, descending))
+    except InvalidQueryParams as e:
+        return jsonify({"message": str(e)}), 400
+
+    columns = load_only_columns(Property, only, always=('id', sort_column.key))
+    if columns is not None:
+        query = query.options(load_only(*columns))
+
+    # Se pide un elemento extra para saber si hay página siguiente
+    page = query.order_by(*keyset_order(sort_column, Property.id, descending)).limit(limit + 1).all()
+    properties = page[:limit]
+
+    headers = {}
+    if len(page) > limit:
+        last = properties[-1]
+        headers['X-Next-Cursor'] = encode_cursor(getattr(last, sort_column.key), last.id)
+    return dump_many(PropertySchema, properties, only), 200, headers
+
+def parse_property_sort(sort):
+    descending = sort.startswith('-')
+    name = sort.lstrip('-')
+    if name == 'id':
+        return Property.id, int, descending
+    if name not in PROPERTY_FILTERS:
+        raise InvalidQueryParams(f"No se puede ordenar por '{name}'")
+    column, convert = PROPERTY_FILTERS[name]
+    return column, convert, descending
+
+@property_bp.route("/property/availability", methods=['GET'])
+@jwt_required()
+@conditional_list('property', 'contract')
+def get_available_properties():
+    """
+    Active properties with no active contract overlapping a date range
+    ---
+    security:
+      - Bearer: []
+    parameters:
+      - name: Authorization
+        in: header
+        type: string
+        required: true
+        description: "JWT Token with 'Bearer ' prefix"
+      - name: start
+        in: query
+        type: string
+        format: date
+        required: true
+        description: "First day of the range (YYYY-MM-DD)"
+      - name: end
+        in: query
+        type: string
+        format: date
+        required: true
+        description: "Last day of the range (YYYY-MM-DD), inclusive"
+      - name: rooms
+        in: query
+        type: integer
+        required: false
+        description: "Same filters, sort, limit, cursor and fields as GET /property"
+    responses:
+      200:
+        description: Page of available properties
+        headers:
+          X-Next-Cursor:
+            type: string
+            description: Cursor for the next page, absent on the last page
+        schema:
+          type: array
+          items:
+            type: object
+      400:
+        description: Missing or invalid date range, filter, sort or cursor
+        schema:
+          type: object
+          properties:
+            message:
+              type: string
+              example: "La fecha 'start' debe ser anterior o igual a 'end'"
+    """
+    try:
+        start, end = parse_date_range(request.args)
+    except InvalidQueryParams as e:
+        return jsonify({"message": str(e)}), 400
+
+    # Anti-join: el índice (property_id, start_date, end_date) resuelve el NOT EXISTS por propiedad
+    busy = exists().where(Contract.property_id == Property.id, *contract_overlaps(start, end))
+    return search_properties(Property.query.filter(Property.active.is_(True), ~busy))
+
+@property_bp.route("/property/<int:property_id>/availability", methods=['GET'])
+@jwt_required()
+def get_property_availability(property_id):
+    """
+    Check whether a property is free for a date range
+    ---
+    security:
+      - Bearer: []
+    parameters:
+      - name: Authorization
+        in: header
+        type: string
+        required: true
+        description: "JWT Token with 'Bearer ' prefix"
+      - name: property_id
+        in: path
+        type: integer
+        required: true
+      - name: start
+        in: query
+        type: string
+        format: date
+        required: true
+      - name: end
+        in: query
+        type: string
+        format: date
+        required: true
+    responses:
+      200:
+        description: Availability of the property
+        schema:
+          type: object
+          properties:
+            property_id:
+              type: integer
+            start:
+              type: string
+              format: date
+            end:
+              type: string
+              format: date
+            available:
+              type: boolean
+              description: False if the property is inactive or has an active contract in the range
+      400:
+        description: Missing or invalid date range
+      404:
+        description: Property not found
+        schema:
+          type: object
+          properties:
+            message:
+              type: string
+              example: "Propiedad no encontrada"
     """
-    properties = Property.query.all()
-    return PropertySchema().dump(properties, many=True)
+    try:
+        start, end = parse_date_range(request.args)
+    except InvalidQueryParams as e:
+        return jsonify({"message": str(e)}), 400
+
+    available = None
+    if current_app.config['AVAILABILITY_INDEX']:
+        available = contract_interval_index.is_available(
+            property_id, start, end, current_app.config['AVAILABILITY_INDEX_TTL']
+        )
+
+    # Sin índice, o la propiedad no figura como activa en él
+    if available is None:
+        active = db.session.execute(select(Property.active).where(Property.id == property_id)).first()
+        if active is None:
+            return jsonify({"message": "Propiedad no encontrada"}), 404
+        busy = db.session.execute(
+            select(exists().where(Contract.property_id == property_id, *contract_overlaps(start, end)))
+        ).scalar()
+        available = bool(active[0]) and not busy
+
+    return jsonify({
+        "property_id": property_id,
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "available": available,
+    })
+
+def parse_date_range(args):
+    dates = []
+    for name in ('start', 'end'):
+        if name not in args:
+            raise InvalidQueryParams(f"El parámetro '{name}' es obligatorio")
+        try:
+            dates.append(date.fromisoformat(args[name]))
+        except ValueError:
+            raise InvalidQueryParams(f"Fecha inválida para '{name}'")
+    if dates[0] > dates[1]:
+        raise InvalidQueryParams("La fecha 'start' debe ser anterior o igual a 'end'")
+    return tuple(dates)
 
 @property_bp.route("/property", methods=['POST'])
 @jwt_required()
@@ -214,6 +475,7 @@ def create_property():
         )
 
         db.session.add(new_property)
+        bump_collection_version('property')
         db.session.commit()
 
         return jsonify({
@@ -227,6 +489,175 @@ def create_property():
             "error": str(e)
         }), 500
 
+@property_bp.route("/property/bulk", methods=['POST'])
+@jwt_required()
+def create_properties_bulk():
+    """
+    Create many properties in one request (Admin only)
+    ---
+    security:
+      - Bearer: []
+    parameters:
+      - name: Authorization
+        in: header
+        type: string
+        required: true
+        description: "JWT Token with 'Bearer ' prefix"
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: array
+          items:
+            type: object
+            properties:
+              address:
+                type: string
+              rooms:
+                type: integer
+              bathrooms:
+                type: integer
+              garage_capacity:
+                type: integer
+              year_built:
+                type: integer
+              property_status_id:
+                type: integer
+              monthly_rent:
+                type: number
+              owner_id:
+                type: integer
+              active:
+                type: boolean
+            required:
+              - address
+              - rooms
+              - bathrooms
+              - monthly_rent
+              - owner_id
+    responses:
+      201:
+        description: Every property was created
+        schema:
+          type: object
+          properties:
+            message:
+              type: string
+              example: "3 de 3 propiedades creadas"
+            results:
+              type: array
+              items:
+                type: object
+                properties:
+                  index:
+                    type: integer
+                    description: Position of the item in the request body
+                  id:
+                    type: integer
+                    description: ID of the created property
+                  errors:
+                    type: object
+                    description: Validation or database errors for the item
+      207:
+        description: Some items failed, see results
+      400:
+        description: Body is not a list or exceeds the maximum size
+      403:
+        description: Unauthorized action (if not admin)
+        schema:
+          type: object
+          properties:
+            message:
+              type: string
+              example: "No tienes permisos para crear propiedades"
+    """
+    additional_data = get_jwt()
+    admin = additional_data.get('is_admin')
+
+    if not admin:
+        return jsonify({
+            "message": "No tienes permisos para crear propiedades"
+        }), 403
+
+    data = request.get_json()
+    max_items = current_app.config['BULK_MAX_ITEMS']
+
+    if not isinstance(data, list):
+        return jsonify({"message": "Se esperaba una lista de propiedades"}), 400
+    if len(data) > max_items:
+        return jsonify({"message": f"Se permiten como máximo {max_items} propiedades por request"}), 400
+
+    errors = PropertySchema(many=True).validate(data)
+    # Un owner_id inexistente haría fallar la FK y con ella todo el lote
+    owner_ids = {int(item['owner_id']) for index, item in enumerate(data) if index not in errors}
+    existing_owners = set(db.session.execute(select(User.id).where(User.id.in_(owner_ids))).scalars()) if owner_ids else set()
+    for index, item in enumerate(data):
+        if index not in errors and int(item['owner_id']) not in existing_owners:
+            errors[index] = {"owner_id": ["Usuario inexistente"]}
+    results = [
+        {"index": index, "errors": item_errors}
+        for index, item_errors in errors.items()
+    ]
+
+    valid = [index for index in range(len(data)) if index not in errors]
+    loaded = PropertySchema(many=True, transient=True).load([data[index] for index in valid])
+    rows = [
+        {
+            column.key: getattr(new_property, column.key)
+            for column in Property.__table__.columns
+            if column.key != 'id'
+        }
+        for new_property in loaded
+    ]
+    for row in rows:
+        if row['active'] is None:
+            row['active'] = True
+
+    chunk_size = current_app.config['BULK_CHUNK_SIZE']
+    for start in range(0, len(rows), chunk_size):
+        indexes = valid[start:start + chunk_size]
+        try:
+            ids = insert_properties(rows[start:start + chunk_size])
+            bump_collection_version('property')
+            db.session.commit()
+            results.extend({"index": index, "id": new_id} for index, new_id in zip(indexes, ids))
+        except Exception as e:
+            db.session.rollback()
+            results.extend({"index": index, "errors": {"_db": [str(e)]}} for index in indexes)
+
+    results.sort(key=lambda result: result["index"])
+    created = sum(1 for result in results if "id" in result)
+
+    return jsonify({
+        "message": f"{created} de {len(data)} propiedades creadas",
+        "results": results
+    }), 201 if created == len(data) else 207
+
+def insert_properties(rows):
+    """Inserta un lote con un único INSERT multi-fila y devuelve los ids en orden."""
+    dialect = db.session.get_bind().dialect
+
+    if dialect.insert_executemany_returning_sort_by_parameter_order:
+        result = db.session.execute(
+            insert(Property).returning(Property.id, sort_by_parameter_order=True),
+            rows
+        )
+        return result.scalars().all()
+
+    if dialect.name == 'mysql':
+        # Un único INSERT ... VALUES (...), (...) armado acá: el executemany de PyMySQL lo parte
+        # en varios si supera max_stmt_length. MySQL asigna los ids de un INSERT simple de a
+        # auto_increment_increment (distinto de 1 con Galera o group replication) desde LAST_INSERT_ID()
+        step = db.session.execute(text('SELECT @@auto_increment_increment')).scalar()
+        result = db.session.execute(insert(Property.__table__).values(rows))
+        first_id = result.lastrowid
+        return list(range(first_id, first_id + len(rows) * step, step))
+
+    new_properties = [Property(**row) for row in rows]
+    db.session.add_all(new_properties)
+    db.session.flush()
+    return [new_property.id for new_property in new_properties]
+
 @property_bp.route("/property", methods=['DELETE'])
 @jwt_required()
 def inactive_property():
@@ -301,8 +732,10 @@ def inactive_property():
 
     propery.active = 0
     db.session.add(propery)
+    bump_collection_version('property')
     try:
         db.session.commit()
+        contract_interval_index.refresh(propery.id)
         return jsonify({"message": "Propiedad eliminada exitosamente"}), 200
     except Exception as e:
         db.session.rollback()
@@ -446,9 +879,11 @@ def update_property():
     for key, value in data.items():
         if key != 'property_id' and hasattr(property, key):
             setattr(property, key, value)
+    bump_collection_version('property')
 
     try:
         db.session.commit()
+        contract_interval_index.refresh(property.id)
         return jsonify({
             "message": "Propiedad actualizada exitosamente",
             "property": PropertySchema().dump(property)
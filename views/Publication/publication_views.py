@@ -1,16 +1,36 @@
-from flask import Blueprint, request, jsonify
+from datetime import date
+from flask import Blueprint, request, jsonify, current_app, g
 from flask_jwt_extended import get_jwt, jwt_required, get_jwt_identity
-from app import db
-from models import Publication
-from schemas import PublicationSchema, MinimalPublicationSchema
+from sqlalchemy import select
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import contains_eager, load_only
+from extensions import db
+from models import Publication, Property, Image, PublicationListing
+from schemas import PublicationSchema, MinimalPublicationSchema, PublicationListingSchema
+from services.pagination import (
+    InvalidQueryParams,
+    parse_limit,
+    encode_cursor,
+    decode_cursor,
+    keyset_order,
+    keyset_filter,
+)
+from services.response_cache import publication_feed_cache
+from services.etag import conditional_list, bump_collection_version
+from services.serializers import dump_many
+from services.fieldsets import parse_fields, load_only_columns
+from services.search_index import publication_search_index
+from services.facets import publication_facets
+from services.feed_snapshot import feed_snapshot
 
 publication_bp = Blueprint('publication', __name__)
 
 @publication_bp.route("/publications", methods=['GET'])
 @jwt_required(optional=True)
+@conditional_list('publication', 'property', 'image', variant=lambda: bool(get_jwt_identity()))
 def get_publications():
     """
-    Retrieve a list of all publications
+    Retrieve a page of active publications, newest first
     ---
     security:
       - Bearer: []
@@ -20,9 +40,28 @@ def get_publications():
         type: string
         required: true
         description: "JWT Token with 'Bearer ' prefix"
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: "Page size (default 20, max 100)"
+      - name: cursor
+        in: query
+        type: string
+        required: false
+        description: "Opaque cursor taken from the X-Next-Cursor header of the previous page"
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: "Comma separated subset of fields to return, nested ones with a dot (e.g. id,title,price_shown,image.url)"
     responses:
       200:
         description: List of publications
+        headers:
+          X-Next-Cursor:
+            type: string
+            description: Cursor for the next page, absent on the last page
         schema:
           type: array
           items:
@@ -63,15 +102,388 @@ def get_publications():
               status:
                 type: string
                 description: The status of the publication (e.g., 'active')
+      400:
+        description: Invalid limit, cursor or fields
+        schema:
+          type: object
+          properties:
+            message:
+              type: string
+              example: "Cursor inválido"
     """
 
     user_id = get_jwt_identity()
-    active_publications = db.session.query(Publication).filter_by(status='active').join(Publication.property).join(Publication.image).all()
+    variant = 'full' if user_id else 'minimal'
+    schema_cls = PublicationSchema if variant == 'full' else MinimalPublicationSchema
+
+    try:
+        limit = parse_limit(request.args)
+        cursor = request.args.get('cursor')
+        after = decode_publication_cursor(cursor) if cursor else None
+        only = parse_fields(request.args, schema_cls)
+    except InvalidQueryParams as e:
+        return jsonify({"message": str(e)}), 400
+
+    build_page = lambda: build_publication_page(schema_cls, after, limit, only)
+    ttl = current_app.config['FEED_CACHE_TTL']
+    # Las versiones ya las leyó conditional_list para el ETag: el cuerpo tiene que ser el de esas mismas versiones
+    versions = g.collection_versions
+
+    page = None
+    if variant == 'minimal' and only is None and current_app.config['FEED_SNAPSHOT_PATH']:
+        page = feed_snapshot.page(after, limit, versions)
+
+    if page is not None:
+        payload, next_cursor = page
+    elif ttl > 0:
+        # Con las versiones en la clave una escritura de cualquier worker deja la entrada vieja sin usar
+        key = (variant, cursor, limit, only, tuple(versions.items()))
+        payload, next_cursor = publication_feed_cache.get_or_build(key, build_page, ttl)
+    else:
+        payload, next_cursor = build_page()
+
+    response = current_app.response_class(payload, mimetype='application/json')
+    if next_cursor:
+        response.headers['X-Next-Cursor'] = next_cursor
+    return response
+
+def build_publication_page(schema_cls, after, limit, only=None):
+    query = publication_query(only).filter(Publication.status == 'active')
+    if after:
+        query = query.filter(keyset_filter(Publication.publish_date, Publication.id, *after))
+
+    # Se pide un elemento extra para saber si hay página siguiente
+    page = query.order_by(*keyset_order(Publication.publish_date, Publication.id)).limit(limit + 1).all()
+    publications = page[:limit]
+
+    payload = current_app.json.dumps(dump_many(schema_cls, publications, only))
+
+    next_cursor = None
+    if len(page) > limit:
+        last = publications[-1]
+        next_cursor = encode_cursor(last.publish_date, last.id)
+    return payload, next_cursor
+
+def publication_query(only=None):
+    # Property e Image se cargan en el mismo JOIN para que los Nested del schema no disparen un SELECT por fila
+    property_loader = contains_eager(Publication.property)
+    image_loader = contains_eager(Publication.image)
+    options = []
+
+    # Con ?fields= se traen solo las columnas pedidas (más las que usa el cursor)
+    columns = load_only_columns(Publication, only, always=('id', 'publish_date'))
+    if columns is not None:
+        options.append(load_only(*columns))
+    property_columns = load_only_columns(Property, only, 'property')
+    if property_columns is not None:
+        property_loader = property_loader.load_only(*property_columns)
+    image_columns = load_only_columns(Image, only, 'image')
+    if image_columns is not None:
+        image_loader = image_loader.load_only(*image_columns)
+
+    return (
+        db.session.query(Publication)
+        .join(Publication.property)
+        .join(Publication.image)
+        .options(property_loader, image_loader, *options)
+    )
+
+def decode_publication_cursor(cursor):
+    publish_date, last_id = decode_cursor(cursor)
+    if publish_date is None:
+        return None, last_id
+    try:
+        return date.fromisoformat(publish_date), last_id
+    except (TypeError, ValueError):
+        raise InvalidQueryParams("Cursor inválido")
+
+@publication_bp.route("/publications/listing", methods=['GET'])
+@conditional_list('publication', 'property', 'image')
+def get_publication_listing():
+    """
+    Flat page of active publications read from the publication_listing table, newest first
+    ---
+    parameters:
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: "Page size (default 20, max 100)"
+      - name: cursor
+        in: query
+        type: string
+        required: false
+        description: "Opaque cursor taken from the X-Next-Cursor header of the previous page"
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: "Comma separated subset of fields to return (e.g. publication_id,title,price_shown,image_url)"
+    responses:
+      200:
+        description: List of publications without nested objects
+        headers:
+          X-Next-Cursor:
+            type: string
+            description: Cursor for the next page, absent on the last page
+        schema:
+          type: array
+          items:
+            type: object
+            properties:
+              publication_id:
+                type: integer
+              property_id:
+                type: integer
+              image_id:
+                type: integer
+              title:
+                type: string
+              price_shown:
+                type: number
+              address:
+                type: string
+              rooms:
+                type: integer
+              bathrooms:
+                type: integer
+              image_url:
+                type: string
+              status:
+                type: string
+              publish_date:
+                type: string
+                format: date
+      400:
+        description: Invalid limit, cursor or fields
+        schema:
+          type: object
+          properties:
+            message:
+              type: string
+              example: "Cursor inválido"
+    """
+    try:
+        limit = parse_limit(request.args)
+        cursor = request.args.get('cursor')
+        after = decode_publication_cursor(cursor) if cursor else None
+        only = parse_fields(request.args, PublicationListingSchema)
+    except InvalidQueryParams as e:
+        return jsonify({"message": str(e)}), 400
+
+    # Una sola tabla: el índice (status, publish_date, publication_id) resuelve filtro, orden y cursor
+    query = PublicationListing.query.filter(PublicationListing.status == 'active')
+    columns = load_only_columns(PublicationListing, only, always=('publication_id', 'publish_date'))
+    if columns is not None:
+        query = query.options(load_only(*columns))
+    if after:
+        query = query.filter(keyset_filter(PublicationListing.publish_date, PublicationListing.publication_id, *after))
 
-    if user_id:
-      return PublicationSchema().dump(active_publications, many=True), 200
+    page = query.order_by(
+        *keyset_order(PublicationListing.publish_date, PublicationListing.publication_id)
+    ).limit(limit + 1).all()
+    listings = page[:limit]
+
+    headers = {}
+    if len(page) > limit:
+        last = listings[-1]
+        headers['X-Next-Cursor'] = encode_cursor(last.publish_date, last.publication_id)
+    return dump_many(PublicationListingSchema, listings, only), 200, headers
+
+@publication_bp.route("/publications/facets", methods=['GET'])
+@jwt_required(optional=True)
+@conditional_list('publication', 'property')
+def get_publication_facets():
+    """
+    Counts of active publications per rooms, bathrooms, garage capacity and price range
+    ---
+    security:
+      - Bearer: []
+    parameters:
+      - name: Authorization
+        in: header
+        type: string
+        required: false
+        description: "JWT Token with 'Bearer ' prefix"
+      - name: rooms
+        in: query
+        type: integer
+        required: false
+        description: "Property filters as in GET /property (rooms, bathrooms, garage_capacity, year_built, monthly_rent, with _min / _max)"
+      - name: price_min
+        in: query
+        type: number
+        required: false
+      - name: price_max
+        in: query
+        type: number
+        required: false
+    responses:
+      200:
+        description: Histograms for the filter sidebar
+        schema:
+          type: object
+          properties:
+            total:
+              type: integer
+            rooms:
+              type: array
+              items:
+                type: object
+                properties:
+                  value:
+                    type: integer
+                  count:
+                    type: integer
+            bathrooms:
+              type: array
+              items:
+                type: object
+            garage_capacity:
+              type: array
+              items:
+                type: object
+            price:
+              type: array
+              items:
+                type: object
+                properties:
+                  min:
+                    type: string
+                    description: Lower bound (inclusive), null for the first range
+                  max:
+                    type: string
+                    description: Upper bound (exclusive), null for the last range
+                  count:
+                    type: integer
+      400:
+        description: Invalid filter value
+        schema:
+          type: object
+          properties:
+            message:
+              type: string
+              example: "Valor inválido para 'rooms_min'"
+    """
+    edges = current_app.config['FACET_PRICE_BUCKETS']
+    build_facets = lambda: current_app.json.dumps(publication_facets(request.args, edges))
+    ttl = current_app.config['FEED_CACHE_TTL']
+
+    try:
+        if ttl > 0:
+            # Comparte la cache del feed; las versiones en la clave son las mismas del ETag
+            key = ('facets', tuple(sorted(request.args.items(multi=True))), tuple(g.collection_versions.items()))
+            payload = publication_feed_cache.get_or_build(key, build_facets, ttl)
+        else:
+            payload = build_facets()
+    except InvalidQueryParams as e:
+        return jsonify({"message": str(e)}), 400
+
+    return current_app.response_class(payload, mimetype='application/json')
+
+@publication_bp.route("/publications/search", methods=['GET'])
+@jwt_required(optional=True)
+def search_publications():
+    """
+    Full-text search over active publication titles and descriptions, best match first
+    ---
+    security:
+      - Bearer: []
+    parameters:
+      - name: Authorization
+        in: header
+        type: string
+        required: false
+        description: "JWT Token with 'Bearer ' prefix"
+      - name: q
+        in: query
+        type: string
+        required: true
+        description: "Search terms; case and accents are ignored (jardin matches Jardín)"
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: "Page size (default 20, max 100)"
+      - name: cursor
+        in: query
+        type: string
+        required: false
+        description: "Opaque cursor taken from the X-Next-Cursor header of the previous page"
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: "Comma separated subset of fields to return, as in GET /publications"
+    responses:
+      200:
+        description: Matching publications, same shape as GET /publications
+        headers:
+          X-Next-Cursor:
+            type: string
+            description: Cursor for the next page, absent on the last page
+        schema:
+          type: array
+          items:
+            type: object
+      400:
+        description: Missing query or invalid limit, cursor or fields
+        schema:
+          type: object
+          properties:
+            message:
+              type: string
+              example: "El parámetro 'q' es obligatorio"
+    """
+    schema_cls = PublicationSchema if get_jwt_identity() else MinimalPublicationSchema
+    terms = request.args.get('q', '').strip()
+
+    try:
+        if not terms:
+            raise InvalidQueryParams("El parámetro 'q' es obligatorio")
+        limit = parse_limit(request.args)
+        cursor = request.args.get('cursor')
+        after = decode_search_cursor(cursor) if cursor else None
+        only = parse_fields(request.args, schema_cls)
+    except InvalidQueryParams as e:
+        return jsonify({"message": str(e)}), 400
+
+    if current_app.config['SEARCH_BACKEND'] == 'mysql':
+        ranked = fulltext_search(terms, after, limit + 1)
     else:
-      return MinimalPublicationSchema().dump(active_publications, many=True), 200
+        ranked = publication_search_index.search(terms, current_app.config['SEARCH_INDEX_TTL'])
+        if after:
+            ranked = [hit for hit in ranked if hit < after]
+        ranked = ranked[:limit + 1]
+
+    page = ranked[:limit]
+    ids = [publication_id for _, publication_id in page]
+    found = {
+        publication.id: publication
+        for publication in publication_query(only).filter(Publication.status == 'active', Publication.id.in_(ids))
+    } if ids else {}
+    publications = [found[publication_id] for publication_id in ids if publication_id in found]
+
+    headers = {}
+    if len(ranked) > limit:
+        headers['X-Next-Cursor'] = encode_cursor(*page[-1])
+    return dump_many(schema_cls, publications, only), 200, headers
+
+def fulltext_search(terms, after, limit):
+    # Requiere el índice FULLTEXT ix_publication_fulltext (solo MySQL)
+    score = match(Publication.title, Publication.description, against=terms)
+    query = select(score, Publication.id).where(Publication.status == 'active', score > 0)
+    if after:
+        query = query.where(keyset_filter(score, Publication.id, *after))
+    query = query.order_by(*keyset_order(score, Publication.id)).limit(limit)
+    return [(float(value), publication_id) for value, publication_id in db.session.execute(query)]
+
+def decode_search_cursor(cursor):
+    score, last_id = decode_cursor(cursor)
+    if not isinstance(score, (int, float)):
+        raise InvalidQueryParams("Cursor inválido")
+    return score, last_id
+
 
 
 
@@ -226,7 +638,11 @@ def create_publication():
         )
 
         db.session.add(new_publication)
+        bump_collection_version('publication')
         db.session.commit()
+        feed_snapshot.schedule_rebuild()
+        if new_publication.status == 'active':
+            publication_search_index.add(new_publication.id, new_publication.title, new_publication.description)
 
         return jsonify({
             "message": f"Publication '{title}' created successfully",
@@ -312,9 +728,12 @@ def inactive_publication():
       }), 404
 
     publication.status = 'inactive'
+    bump_collection_version('publication')
 
     try:
         db.session.commit()
+        feed_snapshot.schedule_rebuild()
+        publication_search_index.remove(publication.id)
         return jsonify({"message": "Publicación eliminada exitosamente"}), 200
     except Exception as e:
         db.session.rollback()
@@ -1,14 +1,20 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import get_jwt, jwt_required
-from werkzeug.security import generate_password_hash
-from app import db
+from sqlalchemy.orm import load_only
+from extensions import db
 from models import User
 from schemas import UserSchema, MinimalUserSchema
+from services.etag import conditional_list, bump_collection_version
+from services.password_hasher import password_hasher, HasherBusy, server_busy
+from services.fieldsets import parse_fields, load_only_columns
+from services.pagination import InvalidQueryParams
+from services.user_status_cache import user_status_cache
 
 user_bp = Blueprint('user', __name__)
 
 @user_bp.route("/users", methods=['GET'])
 @jwt_required()
+@conditional_list('user', variant=lambda: bool(get_jwt().get('is_admin')))
 def get_users():
     """
     Retrieve a list of all users
@@ -21,6 +27,11 @@ def get_users():
         type: string
         required: true
         description: "JWT Token with 'Bearer ' prefix"
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: "Comma separated subset of fields to return (e.g. id,username)"
     responses:
       200:
         description: List of users
@@ -50,11 +61,18 @@ def get_users():
     """
     additional_data = get_jwt()
     admin = additional_data.get('is_admin')
-    users = User.query.all()
+    schema_cls = UserSchema if admin else MinimalUserSchema
+
+    try:
+        only = parse_fields(request.args, schema_cls)
+    except InvalidQueryParams as e:
+        return jsonify({"message": str(e)}), 400
 
-    if admin:
-        return UserSchema().dump(users, many=True)
-    return MinimalUserSchema().dump(users, many=True)
+    query = User.query
+    columns = load_only_columns(User, only)
+    if columns is not None:
+        query = query.options(load_only(*columns))
+    return schema_cls(only=only).dump(query.all(), many=True)
 
 
 @user_bp.route("/users", methods=['POST'])
@@ -129,11 +147,11 @@ def create_user():
     email = data.get('email')
     password = data.get('password')
 
-    passwordHash = generate_password_hash(
-        password=password,
-        method='pbkdf2',
-        salt_length=8
-    )
+    try:
+        passwordHash = password_hasher.hash(password)
+    except HasherBusy:
+        return server_busy()
+
     try:
         nuevo_user = User(
             username=username,
@@ -143,6 +161,7 @@ def create_user():
         )
 
         db.session.add(nuevo_user)
+        bump_collection_version('user')
         db.session.commit()
 
         return jsonify({
@@ -240,13 +259,17 @@ def update_user():
         if email:
             user.email = email
         if password:
-            user.password = generate_password_hash(
-                password=password,
-                method='pbkdf2',
-                salt_length=8
-            )
+            try:
+                user.password = password_hasher.hash(password)
+            except HasherBusy:
+                db.session.rollback()
+                return server_busy()
+            # Cambiar la contraseña invalida los tokens emitidos antes
+            user.token_version += 1
 
+        bump_collection_version('user')
         db.session.commit()
+        user_status_cache.invalidate(user.id)
 
         return jsonify({
             "message": f'Usuario {username} actualizado exitosamenteeee',
@@ -326,7 +349,10 @@ def delete_user():
 
     if user is not None:
         user.is_active = False
+        user.token_version += 1
+        bump_collection_version('user')
         db.session.commit()
+        user_status_cache.invalidate(user.id)
 
         return jsonify({
             "message": f'Usuario {user.username} desactiva3',
@@ -1,14 +1,18 @@
-from .auth_views import auth_bp
-from .Users.user_views import user_bp
-from .Property.property_views import property_bp
-from .Publication.publication_views import publication_bp
-from .Image.image_views import image_bp
-from .Contract.contract_views import contract_bp
+from importlib import import_module
+
+# (módulo, blueprint); se importan recién al registrarlos
+BLUEPRINTS = (
+    ('.auth_views', 'auth_bp'),
+    ('.Users.user_views', 'user_bp'),
+    ('.Property.property_views', 'property_bp'),
+    ('.Publication.publication_views', 'publication_bp'),
+    ('.Image.image_views', 'image_bp'),
+    ('.Contract.contract_views', 'contract_bp'),
+    ('.Export.export_views', 'export_bp'),
+    ('.Monitoring.monitoring_views', 'monitoring_bp'),
+)
 
 def register_bp(app):
-    app.register_blueprint(auth_bp)
-    app.register_blueprint(user_bp)
-    app.register_blueprint(property_bp)
-    app.register_blueprint(publication_bp)
-    app.register_blueprint(image_bp)
-    app.register_blueprint(contract_bp)
+    for module_name, bp_name in BLUEPRINTS:
+        module = import_module(module_name, __name__)
+        app.register_blueprint(getattr(module, bp_name))
@@ -1,17 +1,34 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from datetime import timedelta
 from flask_jwt_extended import (
     create_access_token,
 )
-from werkzeug.security import (
-    generate_password_hash,
-    check_password_hash
-)
-from app import db
+from extensions import db, jwt
 from models import User, Person
+from services.etag import bump_collection_version
+from services.password_hasher import password_hasher, HasherBusy, server_busy
+from services.user_status_cache import user_status_cache
 
 auth_bp = Blueprint('auth', __name__)
 
+@jwt.token_in_blocklist_loader
+def check_if_token_revoked(jwt_header, jwt_payload):
+    user_id = jwt_payload.get('user_id')
+    # Los tokens emitidos antes de agregar user_id/token_version no se pueden validar
+    if user_id is None:
+        return True
+
+    status = user_status_cache.get(user_id, current_app.config['USER_STATUS_CACHE_TTL'])
+    if status is None:
+        return True
+
+    is_active, is_admin, token_version = status
+    return (
+        not is_active
+        or is_admin != jwt_payload.get('is_admin')
+        or token_version != jwt_payload.get('token_version')
+    )
+
 @auth_bp.route("/login", methods=['POST'])
 def login():
     """
@@ -52,19 +69,34 @@ def login():
             message:
               type: string
               example: "Algo malio sal"
+      503:
+        description: Password hashing pool is saturated, retry later
+        schema:
+          type: object
+          properties:
+            message:
+              type: string
+              example: "Servidor ocupado, intenta nuevamente"
     """
     data = request.authorization
     username = data.username
     password = data.password
 
-    user = User.query.filter_by(username=username).first()
+    user = User.query.filter_by(username=username, is_active=True).first()
 
-    if user and check_password_hash(pwhash=user.password, password=password):
+    try:
+        valid_password = user is not None and password_hasher.verify(user.password, password)
+    except HasherBusy:
+        return server_busy()
+
+    if valid_password:
         access_token = create_access_token(
             identity=username,
             expires_delta=timedelta(minutes=50000),
             additional_claims=dict(
                 is_admin=user.is_admin,
+                user_id=user.id,
+                token_version=user.token_version,
             )
         ) 
         return jsonify({
@@ -136,6 +168,8 @@ def register():
             message:
               type: string
               example: "Algo malio sal"
+      503:
+        description: Password hashing pool is saturated, retry later
     """
     data = request.get_json()
 
@@ -153,11 +187,10 @@ def register():
     else:
         is_admin = False
 
-    passwordHash = generate_password_hash(
-        password=password,
-        method='pbkdf2',
-        salt_length=8
-    )
+    try:
+        passwordHash = password_hasher.hash(password)
+    except HasherBusy:
+        return server_busy()
 
     try:
         nueva_persona = Person(
@@ -179,6 +212,7 @@ def register():
         )
 
         db.session.add(nuevo_user)
+        bump_collection_version('user')
         db.session.commit()
 
         return jsonify({
@@ -189,4 +223,4 @@ def register():
         return jsonify({
             "message": 'Algo malio sal',
             "error": str(e)
-        }), 400
\ No newline at end of file
+        }), 400